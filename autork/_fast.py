@@ -0,0 +1,313 @@
+"""autork._fast – матч целиком в одном njit‑ядре для «числовых» стратегий
+
+Часть стратегий (`GreedyExpansionStrategy`, `UltraAggressiveStrategy`,
+`UltraDefensiveStrategy`) – чистая арифметика над наблюдением, без словарей
+и случайности. Для них весь цикл матча (наблюдение → команда → ход движка)
+сводится к эволюции нескольких целых чисел и компилируется Numba целиком.
+
+Стратегия кодируется вектором ``float64``: ``[sid, p0, p1, p2, p3]`` –
+идентификатор и гиперпараметры; команда хода – фиксированные слоты
+``int64[6]`` в порядке полей :class:`autork.engine.Cmd`.
+Правила хода совпадают с :class:`autork.engine.Engine`; результат
+:func:`play_numeric` идентичен `Engine(...).run()`.
+Numba импортируется только здесь; без неё ядро работает как обычный Python
+(медленнее, но с той же семантикой).
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from . import _kernels
+from ._kernels import upkeep_kernel, expand_kernel, buy_stat_kernel
+
+try:
+    from numba import njit
+    from numba.extending import register_jitable
+except ImportError:  # pragma: no cover – Numba не обязателен
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+    def register_jitable(fn):
+        return fn
+
+# функции экономики из `_kernels` – чистый Python для движка; здесь они
+# компилируются внутрь ядра (вне njit‑кода остаются обычными функциями)
+for _fn in (
+    _kernels._units_to_cover, _kernels._series_cost, _kernels._affordable,
+    upkeep_kernel, expand_kernel, buy_stat_kernel,
+):
+    register_jitable(_fn)
+del _fn
+from .config import settings as _default_settings, GameSettings, freeze_settings
+from .strategy import GreedyExpansionStrategy
+from .strategies_demo import UltraAggressiveStrategy, UltraDefensiveStrategy
+
+# идентификаторы стратегий в ядре
+SID_GREEDY = 0
+SID_AGGRESSIVE = 1
+SID_DEFENSIVE = 2
+
+# порядок полей настроек в векторе cfg для ядра
+_CFG_FIELDS = (
+    "MAX_TURNS", "START_GOLD", "START_TERRITORY", "NEUTRAL_TERRITORY",
+    "START_ATTACK", "START_DEFENSE", "GOLD_PER_LAND",
+    "EXPAND_BASE", "EXPAND_STEP", "ATK_BASE", "ATK_K", "DEF_BASE", "DEF_K",
+    "MAINT_ATK", "MAINT_DEF", "SCOUT_COST",
+)
+(
+    _MAX_TURNS, _START_GOLD, _START_TERRITORY, _NEUTRAL_TERRITORY,
+    _START_ATTACK, _START_DEFENSE, _GOLD_PER_LAND,
+    _EXPAND_BASE, _EXPAND_STEP, _ATK_BASE, _ATK_K, _DEF_BASE, _DEF_K,
+    _MAINT_ATK, _MAINT_DEF, _SCOUT_COST,
+) = range(len(_CFG_FIELDS))
+
+# слоты команды (как поля Cmd)
+_EXPAND, _SPEND_ATTACK, _SPEND_DEFENSE, _SELL_ATTACK, _SELL_DEFENSE, _SCOUT = range(6)
+
+# слоты внутреннего состояния стратегии
+_ST_TURN, _ST_SCOUT_CD, _ST_EXPANDED = range(3)
+
+_WINNERS = ("draw", "player1", "player2")
+
+
+# ---------- кодирование ----------
+def encode_strategy(strat) -> Optional[np.ndarray]:
+    """Вектор параметров для ядра или ``None``, если стратегия не числовая.
+
+    Тип сравнивается точно: наследник может переопределить `step()`.
+    """
+    cls = type(strat)
+    if cls is GreedyExpansionStrategy:
+        params = (SID_GREEDY, 0, 0, 0, 0)
+    elif cls is UltraAggressiveStrategy:
+        params = (
+            SID_AGGRESSIVE,
+            strat.reserve_gold, strat.attack_fraction,
+            strat.expand_first_n, strat.scout_every,
+        )
+    elif cls is UltraDefensiveStrategy:
+        params = (
+            SID_DEFENSIVE,
+            strat.defense_floor, strat.defense_focus_turns,
+            strat.save_for_upkeep, strat.expand_budget_ratio,
+        )
+    else:
+        return None
+    return np.array(params, dtype=np.float64)
+
+
+def config_array(game_settings: GameSettings | None = None) -> np.ndarray:
+    """Настройки игры вектором ``int64`` в порядке `_CFG_FIELDS`."""
+    cfg = freeze_settings(game_settings or _default_settings)
+    return np.array([getattr(cfg, name) for name in _CFG_FIELDS], dtype=np.int64)
+
+
+# ---------- ядро ----------
+@njit(cache=True)
+def _init_state(params, state):
+    state[_ST_TURN] = 0
+    state[_ST_SCOUT_CD] = int(params[4]) if int(params[0]) == SID_AGGRESSIVE else 0
+    state[_ST_EXPANDED] = 0
+
+
+@njit(cache=True)
+def _step(params, state, gold, defense, neutral, p_expand, p_defense, p_scout, cmd):
+    """`step()` числовой стратегии: заполнить слоты *cmd*."""
+    for k in range(6):
+        cmd[k] = 0
+    sid = int(params[0])
+    state[_ST_TURN] += 1
+
+    if sid == SID_GREEDY:
+        if p_expand == 0:
+            return  # ZeroDivisionError в Python → пустая команда движка
+        cmd[_EXPAND] = min(neutral, gold // p_expand)
+
+    elif sid == SID_AGGRESSIVE:
+        reserve_gold = int(params[1])
+        attack_fraction = params[2]
+        expand_first_n = int(params[3])
+        scout_every = int(params[4])
+        state[_ST_SCOUT_CD] -= 1
+        if state[_ST_SCOUT_CD] == 0:
+            state[_ST_SCOUT_CD] = scout_every
+            if gold >= p_scout:
+                cmd[_SCOUT] = 1
+                gold -= p_scout
+        if state[_ST_EXPANDED] < expand_first_n and neutral > 0 and gold >= p_expand:
+            cmd[_EXPAND] = 1
+            gold -= p_expand
+            state[_ST_EXPANDED] += 1
+        cmd[_SPEND_ATTACK] = max(0, int((gold - reserve_gold) * attack_fraction))
+
+    else:  # SID_DEFENSIVE
+        defense_floor = int(params[1])
+        defense_focus_turns = int(params[2])
+        save_for_upkeep = int(params[3])
+        expand_budget_ratio = params[4]
+        spend_defense = 0
+        if defense < defense_floor or state[_ST_TURN] <= defense_focus_turns:
+            invest = max(0, gold - save_for_upkeep)
+            if invest:
+                spend_defense = invest
+                gold -= invest
+        if neutral > 0 and gold > p_expand:
+            if p_expand == 0:
+                return  # ZeroDivisionError в Python → пустая команда движка
+            budget = int(gold * expand_budget_ratio)
+            cells = budget // p_expand
+            if cells:
+                cmd[_EXPAND] = cells
+                gold -= cells * p_expand
+        if gold - save_for_upkeep >= p_defense:
+            spend_defense += gold - save_for_upkeep
+        cmd[_SPEND_DEFENSE] = spend_defense
+
+
+@njit(cache=True)
+def _apply_commands(cfg, cmd, gold, atk, dfn, expanded_total):
+    """Как `Engine._apply_commands`; возвращает ``(gold, atk, dfn, pending)``."""
+    units = max(0, min(max(0, cmd[_SELL_ATTACK]), atk))
+    atk -= units
+    gold += units * (cfg[_ATK_BASE] // 2)
+    units = max(0, min(max(0, cmd[_SELL_DEFENSE]), dfn))
+    dfn -= units
+    gold += units * (cfg[_DEF_BASE] // 2)
+
+    gold, pending = expand_kernel(
+        gold, expanded_total, max(0, cmd[_EXPAND]), cfg[_EXPAND_BASE], cfg[_EXPAND_STEP]
+    )
+
+    if cmd[_SCOUT] and gold >= cfg[_SCOUT_COST]:
+        gold -= cfg[_SCOUT_COST]
+
+    gold, atk, _ = buy_stat_kernel(
+        gold, atk, min(max(0, cmd[_SPEND_ATTACK]), gold), cfg[_ATK_BASE], cfg[_ATK_K]
+    )
+    gold, dfn, _ = buy_stat_kernel(
+        gold, dfn, min(max(0, cmd[_SPEND_DEFENSE]), gold), cfg[_DEF_BASE], cfg[_DEF_K]
+    )
+    return gold, atk, dfn, pending
+
+
+@njit(cache=True)
+def simulate_match(params_a, params_b, cfg):
+    """Сыграть матч двух числовых стратегий.
+
+    Возвращает ``int64[11]``: ``winner`` (0 – ничья, 1/2 – игрок), ``turns``,
+    ``neutral`` и ``territory, gold, attack, defense`` каждого игрока.
+    """
+    gold1 = gold2 = cfg[_START_GOLD]
+    terr1 = terr2 = cfg[_START_TERRITORY]
+    atk1 = atk2 = cfg[_START_ATTACK]
+    def1 = def2 = cfg[_START_DEFENSE]
+    exp1 = exp2 = 0
+    neutral = cfg[_NEUTRAL_TERRITORY]
+
+    state1 = np.zeros(3, dtype=np.int64)
+    state2 = np.zeros(3, dtype=np.int64)
+    _init_state(params_a, state1)
+    _init_state(params_b, state2)
+    cmd1 = np.zeros(6, dtype=np.int64)
+    cmd2 = np.zeros(6, dtype=np.int64)
+
+    turn = 0
+    while turn < cfg[_MAX_TURNS]:
+        turn += 1
+        # 1. доход и содержание
+        gold1, atk1, def1 = upkeep_kernel(
+            gold1 + terr1 * cfg[_GOLD_PER_LAND], atk1, def1, cfg[_MAINT_ATK], cfg[_MAINT_DEF]
+        )
+        gold2, atk2, def2 = upkeep_kernel(
+            gold2 + terr2 * cfg[_GOLD_PER_LAND], atk2, def2, cfg[_MAINT_ATK], cfg[_MAINT_DEF]
+        )
+
+        # 2. команды по наблюдениям начала хода
+        _step(
+            params_a, state1, gold1, def1, neutral,
+            cfg[_EXPAND_BASE] + cfg[_EXPAND_STEP] * exp1,
+            cfg[_DEF_BASE] + cfg[_DEF_K] * def1,
+            cfg[_SCOUT_COST], cmd1,
+        )
+        _step(
+            params_b, state2, gold2, def2, neutral,
+            cfg[_EXPAND_BASE] + cfg[_EXPAND_STEP] * exp2,
+            cfg[_DEF_BASE] + cfg[_DEF_K] * def2,
+            cfg[_SCOUT_COST], cmd2,
+        )
+
+        # 3. оплата команд
+        gold1, atk1, def1, a1 = _apply_commands(cfg, cmd1, gold1, atk1, def1, exp1)
+        gold2, atk2, def2, a2 = _apply_commands(cfg, cmd2, gold2, atk2, def2, exp2)
+
+        # 4. нейтрал
+        contested = min(a1, a2, neutral)
+        give1 = min(a1 - contested, neutral - contested)
+        give2 = min(a2 - contested, neutral - contested - give1)
+        terr1 += give1
+        exp1 += give1
+        terr2 += give2
+        exp2 += give2
+        neutral -= give1 + give2
+
+        # 5. бой
+        loss1 = min(max(0, atk2 - def1), terr1)
+        loss2 = min(max(0, atk1 - def2), terr2)
+        terr1 -= loss1
+        terr2 -= loss2
+        neutral += loss1 + loss2
+
+        if terr1 == 0 or terr2 == 0:
+            break
+
+    if terr1 == 0 and terr2 == 0:
+        winner = 0
+    elif terr1 == 0:
+        winner = 2
+    elif terr2 == 0:
+        winner = 1
+    elif gold1 == gold2:
+        winner = 0
+    elif gold1 > gold2:
+        winner = 1
+    else:
+        winner = 2
+
+    out = np.empty(11, dtype=np.int64)
+    out[0] = winner
+    out[1] = turn
+    out[2] = neutral
+    out[3] = terr1
+    out[4] = gold1
+    out[5] = atk1
+    out[6] = def1
+    out[7] = terr2
+    out[8] = gold2
+    out[9] = atk2
+    out[10] = def2
+    return out
+
+
+# ---------- обёртка ----------
+def play_numeric(
+    strat_a,
+    strat_b,
+    game_settings: GameSettings | None = None,
+) -> Optional[Dict[str, Any]]:
+    """Результат в формате `Engine.run()` или ``None``, если ядро не применимо."""
+    params_a = encode_strategy(strat_a)
+    params_b = encode_strategy(strat_b)
+    if params_a is None or params_b is None:
+        return None
+    r = simulate_match(params_a, params_b, config_array(game_settings)).tolist()
+    return {
+        "winner": _WINNERS[r[0]],
+        "turns": r[1],
+        "neutral": r[2],
+        "p1": {"territory": r[3], "gold": r[4], "attack": r[5], "defense": r[6]},
+        "p2": {"territory": r[7], "gold": r[8], "attack": r[9], "defense": r[10]},
+    }
@@ -0,0 +1,103 @@
+"""autork._kernels – «горячая» целочисленная арифметика экономики игрока
+
+Свободные функции на примитивах (int на входе, кортеж int на выходе), которые
+вызывает :class:`autork.engine.PlayerState`. Покупки и роспуск армии считаются
+в замкнутой форме, без поштучных циклов.
+Модуль – чистый Python: из интерпретатора вызов через диспетчер Numba дороже
+самой арифметики. Компилирует их только ядро матча :mod:`autork._fast`,
+встраивая в свой машинный код.
+"""
+from __future__ import annotations
+
+import math
+
+# «без ограничения» для `_affordable` (помещается в int64 ядра)
+_NO_CAP = 2**62
+
+
+def _units_to_cover(deficit, units, price):
+    """Сколько из *units* единиц (по *price* каждая) распустить, чтобы покрыть долг."""
+    if deficit <= 0:
+        return 0
+    if price <= 0:
+        return units  # роспуск не уменьшает долг – уходят все
+    return min(units, (deficit + price - 1) // price)
+
+
+def upkeep_kernel(gold, atk, deff, m_atk, m_def):
+    """Списать содержание; при долге распустить сначала атаку, затем защиту.
+
+    Возвращает ``(gold, atk, deff)``.
+    """
+    gold -= atk * m_atk + deff * m_def
+    if gold >= 0:
+        return gold, atk, deff
+    sell = _units_to_cover(-gold, atk, m_atk)
+    atk -= sell
+    gold += sell * m_atk
+    sell = _units_to_cover(-gold, deff, m_def)
+    deff -= sell
+    gold += sell * m_def
+    if gold < 0:
+        gold = 0
+    return gold, atk, deff
+
+
+def _series_cost(n, base, step, owned):
+    """Суммарная цена *n* единиц: ``Σ base + step * (owned + i)``, i < n."""
+    return n * base + step * (n * owned + n * (n - 1) // 2)
+
+
+def _affordable(budget, base, step, owned, cap):
+    """Наибольшее *n* ≤ *cap*, для которого ``_series_cost(n, ...) ≤ budget``.
+
+    Корень квадратного неравенства
+    ``step*n² + (2*base + step*(2*owned - 1))*n - 2*budget ≤ 0``
+    с точной целочисленной поправкой после `sqrt`.
+    При бесплатных единицах (``step == 0``, ``base ≤ 0``) берётся *cap*.
+    Возвращает ``(n, cost)``.
+    """
+    if budget < 0 or cap <= 0:
+        return 0, 0
+    if step == 0:
+        n = cap if base <= 0 else min(cap, budget // base)
+        return n, n * base
+    b = 2 * base + step * (2 * owned - 1)
+    n = int((math.sqrt(b * b + 8 * step * budget) - b) / (2 * step))
+    if n > cap:
+        n = cap
+    elif n < 0:
+        n = 0
+    cost = _series_cost(n, base, step, owned)
+    # поправка на погрешность float: по одной единице в каждую сторону
+    while cost > budget:
+        n -= 1
+        cost -= base + step * (owned + n)
+    while n < cap:
+        price = base + step * (owned + n)
+        if cost + price > budget:
+            break
+        cost += price
+        n += 1
+    return n, cost
+
+
+def expand_kernel(gold, expanded_total, wanted, base, step):
+    """Купить до *wanted* клеток по цене ``base + step * (expanded_total + i)``.
+
+    Возвращает ``(gold, bought)``.
+    """
+    bought, cost = _affordable(gold, base, step, expanded_total, wanted)
+    return gold - cost, bought
+
+
+def buy_stat_kernel(gold, stat, limit, base, k):
+    """Покупать единицы по цене ``base + k * stat``, пока хватает *limit*.
+
+    Бесплатные единицы (``base ≤ 0``, ``k == 0``) не покупаются: предела нет.
+    Возвращает ``(gold, stat, spent)``.
+    """
+    if k == 0 and base <= 0:
+        return gold, stat, 0
+    units, spent = _affordable(limit, base, k, stat, _NO_CAP)
+    return gold - spent, stat + units, spent
@@ -0,0 +1,40 @@
+"""autork.commands – команда стратегии на ход.
+
+Лёгкий модуль без numpy и движка: его импортируют и `autork.engine`,
+и `autork.strategy`.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, NamedTuple, Union
+
+
+class Cmd(NamedTuple):
+    """Команда стратегии на ход – быстрая альтернатива словарю.
+
+    Поля совпадают с ключами словаря‑команды; `step()` может вернуть
+    и то и другое, словарь движок переводит в `Cmd` сам.
+    """
+
+    expand: int = 0
+    spend_attack: int = 0
+    spend_defense: int = 0
+    sell_attack: int = 0
+    sell_defense: int = 0
+    scout: bool = False
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Cmd":
+        get = d.get
+        return cls(
+            get("expand", 0),
+            get("spend_attack", 0),
+            get("spend_defense", 0),
+            get("sell_attack", 0),
+            get("sell_defense", 0),
+            get("scout", False),
+        )
+
+
+_EMPTY_CMD = Cmd()
+
+Command = Union[Cmd, Dict[str, Any]]
@@ -1,3 +1,5 @@
+from dataclasses import make_dataclass
+
 from pydantic_settings import BaseSettings
 
 class GameSettings(BaseSettings):
@@ -22,4 +24,31 @@ class GameSettings(BaseSettings):
     # разведка
     SCOUT_COST: int = 20
 
+    @classmethod
+    def default(cls) -> "GameSettings":
+        """Общий экземпляр настроек по умолчанию (модульный ``settings``).
+
+        Конструктор каждый раз перечитывает окружение. Экземпляр общий –
+        правка его полей меняет умолчания для всех; изменённую копию
+        даёт ``GameSettings.default().model_copy(update={...})``.
+        """
+        return settings
+
+# Неизменяемый снимок настроек с обычными слотами вместо полей pydantic –
+# его движок читает в горячих циклах (см. freeze_settings).
+GameConfig = make_dataclass(
+    "GameConfig",
+    [(name, field.annotation) for name, field in GameSettings.model_fields.items()],
+    frozen=True,
+    slots=True,
+)
+
+
+def freeze_settings(cfg) -> GameConfig:
+    """Снять неизменяемую копию `GameSettings` (`GameConfig` возвращается как есть)."""
+    if isinstance(cfg, GameConfig):
+        return cfg
+    return GameConfig(**cfg.model_dump())
+
+
 settings = GameSettings()      # доступен из других модулей
@@ -18,17 +18,32 @@ from __future__ import annotations
 
 from typing import Any, Callable, Dict, List, Tuple
 
-from .config import settings as _default_settings, GameSettings
+import numpy as np
+
+from .config import settings as _default_settings, GameSettings, GameConfig, freeze_settings
+from ._kernels import upkeep_kernel, expand_kernel, buy_stat_kernel
+from .commands import Cmd, Command, _EMPTY_CMD  # реэкспорт: autork.engine.Cmd
 
 # ---------------------------------------------------------
-Command = Dict[str, Any]
 Observation = Dict[str, Any]
 TraceFn = Callable[[str], None]
 
+# столбцы Engine.history (одна строка на ход)
+HISTORY_COLUMNS: Tuple[str, ...] = (
+    "turn", "neutral",
+    "p1_territory", "p1_gold", "p1_attack", "p1_defense",
+    "p2_territory", "p2_gold", "p2_attack", "p2_defense",
+)
+
 
 class PlayerState:
     """Хранит состояние игрока и ссылается на объект настроек."""
 
+    __slots__ = (
+        "cfg", "gold", "territory", "attack", "defense",
+        "expanded_total", "pending_expands", "has_enemy_intel",
+    )
+
     def __init__(self, cfg: GameSettings):
         self.cfg = cfg
         self.gold: int = cfg.START_GOLD
@@ -39,6 +54,17 @@ class PlayerState:
         self.pending_expands: int = 0  # заявки на текущий ход – сколько клеток куплено
         self.has_enemy_intel: bool = False
 
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__[1:])
+        return f"PlayerState({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlayerState):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # изменяемое состояние
+
     # ---------- экономика ----------
     def income(self) -> int:
         return self.territory * self.cfg.GOLD_PER_LAND
@@ -47,21 +73,10 @@ class PlayerState:
         return self.attack * self.cfg.MAINT_ATK + self.defense * self.cfg.MAINT_DEF
 
     def apply_upkeep(self) -> None:
-        self.gold -= self.upkeep_cost()
-        if self.gold >= 0:
-            return
-        deficit = -self.gold
-        while deficit > 0 and (self.attack or self.defense):
-            if self.attack:
-                self.attack -= 1
-                self.gold += self.cfg.MAINT_ATK
-                deficit -= self.cfg.MAINT_ATK
-            elif self.defense:
-                self.defense -= 1
-                self.gold += self.cfg.MAINT_DEF
-                deficit -= self.cfg.MAINT_DEF
-        if self.gold < 0:
-            self.gold = 0
+        cfg = self.cfg
+        self.gold, self.attack, self.defense = upkeep_kernel(
+            self.gold, self.attack, self.defense, cfg.MAINT_ATK, cfg.MAINT_DEF
+        )
 
     # ---------- покупки ----------
     def expand_price(self, extra: int = 0) -> int:
@@ -75,13 +90,10 @@ class PlayerState:
         Возвращает количество **заявленных** клеток (может быть меньше wanted),
         ограниченное текущим запасом золота.
         """
-        bought = 0
-        while bought < wanted:
-            cost = self.expand_price(extra=bought)
-            if self.gold < cost:
-                break
-            self.gold -= cost
-            bought += 1
+        cfg = self.cfg
+        self.gold, bought = expand_kernel(
+            self.gold, self.expanded_total, wanted, cfg.EXPAND_BASE, cfg.EXPAND_STEP
+        )
         self.pending_expands = bought
         return bought
 
@@ -93,21 +105,17 @@ class PlayerState:
         return self.cfg.DEF_BASE + self.cfg.DEF_K * self.defense
 
     def buy_attack(self, gold_limit: int) -> int:
-        spent = 0
-        while gold_limit - spent >= self._attack_price():
-            price = self._attack_price()
-            self.attack += 1
-            spent += price
-        self.gold -= spent
+        cfg = self.cfg
+        self.gold, self.attack, spent = buy_stat_kernel(
+            self.gold, self.attack, gold_limit, cfg.ATK_BASE, cfg.ATK_K
+        )
         return spent
 
     def buy_defense(self, gold_limit: int) -> int:
-        spent = 0
-        while gold_limit - spent >= self._defense_price():
-            price = self._defense_price()
-            self.defense += 1
-            spent += price
-        self.gold -= spent
+        cfg = self.cfg
+        self.gold, self.defense, spent = buy_stat_kernel(
+            self.gold, self.defense, gold_limit, cfg.DEF_BASE, cfg.DEF_K
+        )
         return spent
 
     def _refund_attack(self, units: int) -> int:
@@ -129,6 +137,14 @@ class PlayerState:
 class Engine:
     """Оркестратор матча (бот vs бот)."""
 
+    __slots__ = (
+        "cfg", "s1", "s2", "trace", "_tracing",
+        "turn", "neutral_territory", "p1", "p2", "history",
+    )
+
+    # ключи команды, которые понимает движок
+    _KNOWN_CMD_KEYS = frozenset(Cmd._fields)
+
     def __init__(
         self,
         strat_a,
@@ -137,10 +153,13 @@ class Engine:
         trace: TraceFn | None = print,
         game_settings: GameSettings | None = None,
     ) -> None:
-        self.cfg: GameSettings = game_settings or _default_settings
+        # снимок настроек: обычные атрибуты без накладных расходов pydantic
+        self.cfg: GameConfig = freeze_settings(game_settings or _default_settings)
         self.s1 = strat_a
         self.s2 = strat_b
         self.trace: TraceFn = trace or (lambda *_: None)
+        # без trace сообщения даже не форматируются
+        self._tracing: bool = trace is not None
         # Сразу готовим место под историю и состояние
         self.reset()
 
@@ -154,28 +173,31 @@ class Engine:
         self.neutral_territory: int = self.cfg.NEUTRAL_TERRITORY
         self.p1 = PlayerState(self.cfg)
         self.p2 = PlayerState(self.cfg)
-        self.history: List[Dict[str, Any]] = []
+        self.history: np.ndarray = np.zeros(
+            (self.cfg.MAX_TURNS + 1, len(HISTORY_COLUMNS)), dtype=np.int64
+        )
         self._record_snapshot()  # начальное состояние (turn=0)
 
     def _record_snapshot(self) -> None:
-        self.history.append(
+        p1, p2 = self.p1, self.p2
+        self.history[self.turn] = (
+            self.turn,
+            self.neutral_territory,
+            p1.territory, p1.gold, p1.attack, p1.defense,
+            p2.territory, p2.gold, p2.attack, p2.defense,
+        )
+
+    def history_as_dicts(self) -> List[Dict[str, Any]]:
+        """История матча в прежнем формате: список словарей по ходам."""
+        return [
             {
-                "turn": self.turn,
-                "neutral": self.neutral_territory,
-                "p1": {
-                    "territory": self.p1.territory,
-                    "gold": self.p1.gold,
-                    "attack": self.p1.attack,
-                    "defense": self.p1.defense,
-                },
-                "p2": {
-                    "territory": self.p2.territory,
-                    "gold": self.p2.gold,
-                    "attack": self.p2.attack,
-                    "defense": self.p2.defense,
-                },
+                "turn": row[0],
+                "neutral": row[1],
+                "p1": {"territory": row[2], "gold": row[3], "attack": row[4], "defense": row[5]},
+                "p2": {"territory": row[6], "gold": row[7], "attack": row[8], "defense": row[9]},
             }
-        )
+            for row in self.history[: self.turn + 1].tolist()
+        ]
 
     # --------------------------------------------------
     def run(self) -> Dict[str, Any]:
@@ -186,16 +208,20 @@ class Engine:
 
         self._render()
         
-        while self.turn < self.cfg.MAX_TURNS:
+        max_turns = self.cfg.MAX_TURNS
+        while self.turn < max_turns:
             if not self._handle_gui_events():
                 break
 
             self.turn += 1
-            self.trace(f"\n--- TURN {self.turn} ---")
+            if self._tracing:
+                self.trace(f"\n--- TURN {self.turn} ---")
             self._play_turn()
+            self._record_snapshot()
             self._render()
             if self._winner_declared():
                 break
+        self.history = self.history[: self.turn + 1]
         result = self._result(is_end=True)
         self.trace("\n=== RESULT ===")
         self.trace(result)
@@ -214,16 +240,17 @@ class Engine:
         for pid, pl in enumerate((self.p1, self.p2), start=1):
             pl.gold += pl.income()
             pl.apply_upkeep()
-            self.trace(
-                f"P{pid} income=+{pl.income()} upkeep=-{pl.upkeep_cost()} gold={pl.gold}"
-            )
+            if self._tracing:
+                self.trace(
+                    f"P{pid} income=+{pl.income()} upkeep=-{pl.upkeep_cost()} gold={pl.gold}"
+                )
 
         # 2. Подготовить наблюдения и запросить команды
         obs1, prices1 = self._prepare_obs(self.p1, self.p2)
         obs2, prices2 = self._prepare_obs(self.p2, self.p1)
 
-        cmd1 = self._safe_step(self.s1, obs1)
-        cmd2 = self._safe_step(self.s2, obs2)
+        cmd1 = self._safe_step(self.s1, obs1, pid=1)
+        cmd2 = self._safe_step(self.s2, obs2, pid=2)
 
         # 3. Обработать команды (списать деньги, но **не** менять нейтрал)
         self._apply_commands(self.p1, cmd1, prices1, pid=1)
@@ -236,17 +263,27 @@ class Engine:
         self._resolve_combat()
 
         # 6. Обновить разведку
-        self.p1.has_enemy_intel = cmd1.get("scout", False)
-        self.p2.has_enemy_intel = cmd2.get("scout", False)
+        self.p1.has_enemy_intel = cmd1.scout
+        self.p2.has_enemy_intel = cmd2.scout
 
     # ---------- наблюдения ----------
     def _prepare_obs(self, me: PlayerState, enemy: PlayerState) -> Tuple[Observation, Dict[str, int]]:
+        """Свежее наблюдение игрока *me*: стратегия вправе хранить его между ходами."""
         prices = {
             "expand_next": me.expand_price(),
             "buy_attack": me._attack_price(),
             "buy_defense": me._defense_price(),
             "scout": self.cfg.SCOUT_COST,
         }
+        if me.has_enemy_intel:
+            en = {
+                "territory": enemy.territory,
+                "gold": enemy.gold,
+                "attack": enemy.attack,
+                "defense": enemy.defense,
+            }
+        else:
+            en = {"territory": enemy.territory}
         obs: Observation = {
             "turn": self.turn,
             "my": {
@@ -255,16 +292,7 @@ class Engine:
                 "attack": me.attack,
                 "defense": me.defense,
             },
-            "enemy": {"territory": enemy.territory}
-            | (
-                {
-                    "gold": enemy.gold,
-                    "attack": enemy.attack,
-                    "defense": enemy.defense,
-                }
-                if me.has_enemy_intel
-                else {}
-            ),
+            "enemy": en,
             "neutral_territory": self.neutral_territory,
             "prices": prices,
             "limits": {"gold": me.gold},
@@ -280,102 +308,104 @@ class Engine:
         return obs
 
     # ---------- команды ----------
-    def _safe_step(self, strat, obs: Observation) -> Command:
+    def _safe_step(self, strat, obs: Observation, *, pid: int = 0) -> Cmd:
         try:
             res = strat.step(obs)
+            if isinstance(res, Cmd):
+                return res
             if not isinstance(res, dict):
-                raise TypeError("Strategy.step must return dict")
-            return res
+                raise TypeError("Strategy.step must return dict or Cmd")
         except Exception as exc:
-            self.trace(f"[ERROR] Strategy {strat} crashed: {exc}")
-            return {}
+            if self._tracing:
+                self.trace(f"[ERROR] Strategy {strat} crashed: {exc}")
+            return _EMPTY_CMD
+        # неведомые ключи
+        if self._tracing:
+            for k in res.keys() - self._KNOWN_CMD_KEYS:
+                self.trace(f"P{pid} unknown key '{k}' ignored")
+        return Cmd.from_dict(res)
 
     def _apply_commands(
         self,
         player: PlayerState,
-        cmd: Command,
+        cmd: Cmd,
         prices: Dict[str, int],
         *,
         pid: int,
     ) -> None:
         
-        sell_atk  = max(0, int(cmd.get("sell_attack", 0)))
+        sell_atk  = max(0, int(cmd.sell_attack))
         if sell_atk:
             ref = player._refund_attack(sell_atk)
-            self.trace(f"P{pid} sell {sell_atk} atk (+{ref}g)")
+            if self._tracing:
+                self.trace(f"P{pid} sell {sell_atk} atk (+{ref}g)")
 
-        sell_def  = max(0, int(cmd.get("sell_defense", 0)))
+        sell_def  = max(0, int(cmd.sell_defense))
         if sell_def:
             ref = player._refund_defense(sell_def)
-            self.trace(f"P{pid} sell {sell_def} def (+{ref}g)")
+            if self._tracing:
+                self.trace(f"P{pid} sell {sell_def} def (+{ref}g)")
 
         # ----- expand (только деньги + заявка) -----
-        want_expand = max(0, int(cmd.get("expand", 0)))
+        want_expand = max(0, int(cmd.expand))
         bought = player.pay_for_expands(want_expand)
         if bought < want_expand:
-            self.trace(f"P{pid} expand limited by gold to {bought}/{want_expand}")
+            if self._tracing:
+                self.trace(f"P{pid} expand limited by gold to {bought}/{want_expand}")
 
         # ----- scout -----
-        if cmd.get("scout", False):
-            if player.gold >= self.cfg.SCOUT_COST:
-                player.gold -= self.cfg.SCOUT_COST
-                self.trace(f"P{pid} scout (-{self.cfg.SCOUT_COST}g)")
-            else:
+        if cmd.scout:
+            scout_cost = self.cfg.SCOUT_COST
+            if player.gold >= scout_cost:
+                player.gold -= scout_cost
+                if self._tracing:
+                    self.trace(f"P{pid} scout (-{scout_cost}g)")
+            elif self._tracing:
                 self.trace(f"P{pid} cannot afford scout")
 
         # ----- attack / defense -----
-        atk_spend = max(0, int(cmd.get("spend_attack", 0)))
+        atk_spend = max(0, int(cmd.spend_attack))
         atk_spend = min(atk_spend, player.gold)
         real_atk = player.buy_attack(atk_spend)
         if real_atk < atk_spend:
-            self.trace(f"P{pid} atk spend trimmed to {real_atk}/{atk_spend}")
+            if self._tracing:
+                self.trace(f"P{pid} atk spend trimmed to {real_atk}/{atk_spend}")
 
-        def_spend = max(0, int(cmd.get("spend_defense", 0)))
+        def_spend = max(0, int(cmd.spend_defense))
         def_spend = min(def_spend, player.gold)
         real_def = player.buy_defense(def_spend)
         if real_def < def_spend:
-            self.trace(f"P{pid} def spend trimmed to {real_def}/{def_spend}")
-
-        # неведомые ключи
-        for k in cmd.keys() - {"sell_attack", "sell_defense", "expand", "spend_attack", "spend_defense", "scout"}:
-            self.trace(f"P{pid} unknown key '{k}' ignored")
+            if self._tracing:
+                self.trace(f"P{pid} def spend trimmed to {real_def}/{def_spend}")
 
     # ---------- распределение нейтрала ----------
     def _allocate_neutral(self):
-        a1 = self.p1.pending_expands
-        a2 = self.p2.pending_expands
+        p1, p2 = self.p1, self.p2
+        a1 = p1.pending_expands
+        a2 = p2.pending_expands
         N = self.neutral_territory
 
-        # Оспоренные клетки – первые min(a1, a2, N)
+        # Оспоренные клетки – первые min(a1, a2, N): обе стороны платят,
+        # клетки остаются нейтральными. Остаток нейтрала выдаётся по очереди.
         contested = min(a1, a2, N)
-        remaining_neutral = N - contested
-
-        r1_unique = a1 - contested
-        r2_unique = a2 - contested
+        give1 = min(a1 - contested, N - contested)
+        give2 = min(a2 - contested, N - contested - give1)
 
-        # Выдать оставшийся нейтрал по очереди (справедливо)
-        give1 = min(r1_unique, remaining_neutral)
-        remaining_neutral -= give1
-        give2 = min(r2_unique, remaining_neutral)
-        remaining_neutral -= give2
+        p1.territory += give1
+        p1.expanded_total += give1
+        p2.territory += give2
+        p2.expanded_total += give2
+        self.neutral_territory = N - give1 - give2
 
-        # Обновляем состояние игроков
-        self.p1.territory += give1
-        self.p1.expanded_total += give1
-        self.p2.territory += give2
-        self.p2.expanded_total += give2
-
-        # Итоговое количество нейтрала
-        self.neutral_territory = remaining_neutral + contested
-
-        self.trace(
-            f"Expands: P1 want={a1} P2 want={a2} | contested={contested} "
-            f"granted P1={give1} P2={give2} | neutral={self.neutral_territory}"
-        )
+        if self._tracing:
+            self.trace(
+                f"Expands: P1 want={a1} P2 want={a2} | contested={contested} "
+                f"granted P1={give1} P2={give2} | neutral={self.neutral_territory}"
+            )
 
         # очистить заявки на следующий ход
-        self.p1.pending_expands = 0
-        self.p2.pending_expands = 0
+        p1.pending_expands = 0
+        p2.pending_expands = 0
 
     # ---------- бой ----------
     def _resolve_combat(self):
@@ -389,10 +419,11 @@ class Engine:
         self.p2.territory -= loss2
         self.neutral_territory += loss1 + loss2
 
-        self.trace(
-            f"Combat: P1 dmg={dmg12} P2 dmg={dmg21} | terr P1={self.p1.territory} "
-            f"P2={self.p2.territory} neutral={self.neutral_territory}"
-        )
+        if self._tracing:
+            self.trace(
+                f"Combat: P1 dmg={dmg12} P2 dmg={dmg21} | terr P1={self.p1.territory} "
+                f"P2={self.p2.territory} neutral={self.neutral_territory}"
+            )
 
     # ---------- победитель ----------
     def _winner_declared(self) -> bool:
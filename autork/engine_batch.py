@@ -0,0 +1,370 @@
+"""autork.engine_batch – пакетный движок: N матчей одновременно
+
+Состояние всех матчей хранится «по столбцам» (SoA): каждое поле игрока –
+отдельный вектор длины N (`gold1`, `terr1`, `atk1`, `def1`, `exp_total1`,
+`pending1` и то же с суффиксом `_2`) плюс общий вектор `neutral`.
+Вся бухгалтерия хода (доход, содержание, покупки, колонизация нейтрала, бой)
+выполняется векторными операциями NumPy сразу над всеми живыми матчами.
+По одному матчу в цикле Python вызывается только `strategy.step()`.
+
+Правила полностью совпадают с :class:`autork.engine.Engine` – результаты
+`run_many` идентичны последовательным вызовам `Engine.run()` для
+детерминированных стратегий.
+Векторы окупаются лишь на десятках матчей: один матч `BatchEngine` играет
+~в 10 раз медленнее `Engine`, поэтому `run_many` при ``n_matches`` меньше
+`MIN_BATCH` играет матчи последовательно через `Engine`.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from .config import settings as _default_settings, GameSettings, GameConfig, freeze_settings
+from .engine import Cmd, Engine, Observation, _EMPTY_CMD
+
+StratFactory = Callable[[], Any]
+
+_DT = np.int64          # тип хранения состояния (как int Python в `Engine` – без переполнений)
+_CMD_DT = np.int64      # тип для заявок стратегий (могут быть большими)
+_NO_CAP = np.iinfo(_CMD_DT).max
+
+# с какого числа матчей `run_many` играет их векторно (точка безубыточности
+# по замерам на демо‑стратегиях – 40–60 матчей)
+MIN_BATCH = 64
+
+
+def _affordable(budget, base: int, step: int, owned, cap):
+    """Сколько единиц можно купить по арифметической прогрессии цен.
+
+    Цена i‑й единицы (i = 0, 1, …) равна ``base + step * (owned + i)``.
+    Возвращает пару ``(count, total)`` – максимальное количество ``count ≤ cap``,
+    суммарная стоимость которого ``total`` не превышает ``budget``.
+    """
+    budget = np.maximum(np.asarray(budget, dtype=np.int64), 0)
+    owned = np.asarray(owned, dtype=np.int64)
+    if step == 0:
+        if base <= 0:
+            count = np.asarray(cap, dtype=np.int64).copy()
+        else:
+            count = budget // base
+    else:
+        # step*b² + (2*base + step*(2*owned - 1))*b - 2*budget ≤ 0
+        b = 2.0 * base + step * (2.0 * owned - 1.0)
+        disc = b * b + 8.0 * step * budget
+        count = np.floor((-b + np.sqrt(disc)) / (2.0 * step)).astype(np.int64)
+        count = np.maximum(count, 0)
+
+        def total(n):
+            return n * base + step * (n * owned + n * (n - 1) // 2)
+
+        # поправка на погрешность float
+        count = np.where(total(count) > budget, count - 1, count)
+        count = np.where(total(count + 1) <= budget, count + 1, count)
+    count = np.minimum(np.maximum(count, 0), cap)
+    cost = count * base + step * (count * owned + count * (count - 1) // 2)
+    return count, cost
+
+
+def _stat_cap(base: int, k: int) -> int:
+    """Предел покупки атаки/защиты: бесплатные единицы не покупаются (как в `Engine`)."""
+    return 0 if k == 0 and base <= 0 else _NO_CAP
+
+
+class BatchEngine:
+    """N независимых матчей «стратегия A vs стратегия B» в одном векторе."""
+
+    def __init__(
+        self,
+        strat_factory_a: StratFactory,
+        strat_factory_b: StratFactory,
+        n_matches: int,
+        *,
+        game_settings: GameSettings | None = None,
+    ) -> None:
+        self.cfg: GameConfig = freeze_settings(game_settings or _default_settings)
+        self.n = int(n_matches)
+        self.s1 = [strat_factory_a() for _ in range(self.n)]
+        self.s2 = [strat_factory_b() for _ in range(self.n)]
+        self.reset()
+
+    # ---------- служебные ----------
+    def reset(self) -> None:
+        """Начальное состояние во всех N матчах."""
+        cfg, n = self.cfg, self.n
+        self.turn: int = 0
+
+        self.neutral = np.full(n, cfg.NEUTRAL_TERRITORY, dtype=_DT)
+        for sfx in ("1", "2"):
+            setattr(self, "gold" + sfx, np.full(n, cfg.START_GOLD, dtype=_DT))
+            setattr(self, "terr" + sfx, np.full(n, cfg.START_TERRITORY, dtype=_DT))
+            setattr(self, "atk" + sfx, np.full(n, cfg.START_ATTACK, dtype=_DT))
+            setattr(self, "def" + sfx, np.full(n, cfg.START_DEFENSE, dtype=_DT))
+            setattr(self, "exp_total" + sfx, np.zeros(n, dtype=_DT))
+            setattr(self, "pending" + sfx, np.zeros(n, dtype=_DT))
+            setattr(self, "intel" + sfx, np.zeros(n, dtype=bool))
+
+        self.done = np.zeros(n, dtype=bool)
+        self.turns = np.zeros(n, dtype=_DT)
+
+    # --------------------------------------------------
+    def run(self) -> List[Dict[str, Any]]:
+        self.reset()
+        for i in range(self.n):
+            obs1, obs2 = self._observations(i)
+            self.s1[i].reset(obs1)
+            self.s2[i].reset(obs2)
+
+        while self.turn < self.cfg.MAX_TURNS and not self.done.all():
+            self.turn += 1
+            live = np.flatnonzero(~self.done)
+            self.turns[live] = self.turn
+            self._play_turn(live)
+
+            finished = (self.terr1 == 0) | (self.terr2 == 0)
+            self.done |= finished
+        return [self._result(i) for i in range(self.n)]
+
+    # --------------------------------------------------
+    def _play_turn(self, live: np.ndarray) -> None:
+        cfg = self.cfg
+        # 1. Экономика и содержание
+        for sfx in ("1", "2"):
+            gold = getattr(self, "gold" + sfx)
+            terr = getattr(self, "terr" + sfx)
+            atk = getattr(self, "atk" + sfx)
+            dfn = getattr(self, "def" + sfx)
+            g = gold[live] + terr[live] * cfg.GOLD_PER_LAND
+            g, a, d = self._apply_upkeep(g, atk[live], dfn[live])
+            gold[live], atk[live], dfn[live] = g, a, d
+
+        # 2. Наблюдения и команды (единственная часть на Python по матчам)
+        cmds1: List[Cmd] = []
+        cmds2: List[Cmd] = []
+        for i in live.tolist():
+            obs1, obs2 = self._observations(i)
+            cmds1.append(self._safe_step(self.s1[i], obs1))
+            cmds2.append(self._safe_step(self.s2[i], obs2))
+
+        # 3. Обработать команды
+        scout1 = self._apply_commands("1", live, cmds1)
+        scout2 = self._apply_commands("2", live, cmds2)
+
+        # 4. Распределить нейтрал
+        self._allocate_neutral(live)
+
+        # 5. Сражение
+        self._resolve_combat(live)
+
+        # 6. Обновить разведку
+        self.intel1[live] = scout1
+        self.intel2[live] = scout2
+
+    # ---------- экономика ----------
+    def _apply_upkeep(self, gold, atk, dfn):
+        """Содержание армии; при нехватке распускается сначала атака, затем защита."""
+        m_atk, m_def = self.cfg.MAINT_ATK, self.cfg.MAINT_DEF
+        gold = gold - (atk * m_atk + dfn * m_def)
+
+        deficit = np.maximum(-gold, 0)
+        if m_atk > 0:
+            drop_atk = np.minimum(atk, (deficit + m_atk - 1) // m_atk)
+        else:
+            drop_atk = np.where(deficit > 0, atk, 0)
+        atk = atk - drop_atk
+        gold = gold + drop_atk * m_atk
+
+        deficit = np.maximum(-gold, 0)
+        if m_def > 0:
+            drop_def = np.minimum(dfn, (deficit + m_def - 1) // m_def)
+        else:
+            drop_def = np.where(deficit > 0, dfn, 0)
+        dfn = dfn - drop_def
+        gold = gold + drop_def * m_def
+
+        return np.maximum(gold, 0), atk, dfn
+
+    # ---------- наблюдения ----------
+    def _observations(self, i: int):
+        return (
+            self._prepare_obs(i, "1", "2"),
+            self._prepare_obs(i, "2", "1"),
+        )
+
+    def _prepare_obs(self, i: int, me: str, en: str) -> Observation:
+        cfg = self.cfg
+        gold = int(getattr(self, "gold" + me)[i])
+        attack = int(getattr(self, "atk" + me)[i])
+        defense = int(getattr(self, "def" + me)[i])
+        enemy: Dict[str, int] = {"territory": int(getattr(self, "terr" + en)[i])}
+        if getattr(self, "intel" + me)[i]:
+            enemy["gold"] = int(getattr(self, "gold" + en)[i])
+            enemy["attack"] = int(getattr(self, "atk" + en)[i])
+            enemy["defense"] = int(getattr(self, "def" + en)[i])
+        return {
+            "turn": self.turn,
+            "my": {
+                "gold": gold,
+                "territory": int(getattr(self, "terr" + me)[i]),
+                "attack": attack,
+                "defense": defense,
+            },
+            "enemy": enemy,
+            "neutral_territory": int(self.neutral[i]),
+            "prices": {
+                "expand_next": cfg.EXPAND_BASE
+                + cfg.EXPAND_STEP * int(getattr(self, "exp_total" + me)[i]),
+                "buy_attack": cfg.ATK_BASE + cfg.ATK_K * attack,
+                "buy_defense": cfg.DEF_BASE + cfg.DEF_K * defense,
+                "scout": cfg.SCOUT_COST,
+            },
+            "limits": {"gold": gold},
+        }
+
+    # ---------- команды ----------
+    @staticmethod
+    def _safe_step(strat, obs: Observation) -> Cmd:
+        try:
+            res = strat.step(obs)
+            if isinstance(res, Cmd):
+                return res
+            if not isinstance(res, dict):
+                raise TypeError("Strategy.step must return dict or Cmd")
+        except Exception:
+            return _EMPTY_CMD
+        return Cmd.from_dict(res)
+
+    def _apply_commands(self, sfx: str, live: np.ndarray, cmds: List[Cmd]) -> np.ndarray:
+        """Векторная версия :meth:`Engine._apply_commands`; возвращает флаги разведки."""
+        cfg = self.cfg
+        # столбцы команд в порядке полей Cmd
+        columns = dict(zip(Cmd._fields, zip(*cmds)))
+        # заявки сверх int64 урезаются: больше, чем позволяет золото, не купить,
+        # а бесплатных клеток движок всё равно не отдаст больше нейтрала
+        want = {
+            k: np.array([min(max(0, int(v)), _NO_CAP) for v in columns[k]], dtype=_CMD_DT)
+            for k in ("sell_attack", "sell_defense", "expand", "spend_attack", "spend_defense")
+        }
+        scout = np.array([bool(v) for v in columns["scout"]], dtype=bool)
+
+        gold = getattr(self, "gold" + sfx)[live]
+        atk = getattr(self, "atk" + sfx)[live]
+        dfn = getattr(self, "def" + sfx)[live]
+        exp_total = getattr(self, "exp_total" + sfx)[live]
+
+        # продажа
+        units = np.minimum(want["sell_attack"], atk)
+        atk -= units
+        gold += units * (cfg.ATK_BASE // 2)
+        units = np.minimum(want["sell_defense"], dfn)
+        dfn -= units
+        gold += units * (cfg.DEF_BASE // 2)
+
+        # заявки на расширение (деньги списываются сразу)
+        bought, cost = _affordable(gold, cfg.EXPAND_BASE, cfg.EXPAND_STEP, exp_total, want["expand"])
+        gold -= cost
+
+        # разведка
+        paid = scout & (gold >= cfg.SCOUT_COST)
+        gold -= np.where(paid, cfg.SCOUT_COST, 0)
+
+        # атака / защита
+        limit = np.minimum(want["spend_attack"], gold)
+        units, cost = _affordable(limit, cfg.ATK_BASE, cfg.ATK_K, atk, _stat_cap(cfg.ATK_BASE, cfg.ATK_K))
+        atk += units
+        gold -= cost
+        limit = np.minimum(want["spend_defense"], gold)
+        units, cost = _affordable(limit, cfg.DEF_BASE, cfg.DEF_K, dfn, _stat_cap(cfg.DEF_BASE, cfg.DEF_K))
+        dfn += units
+        gold -= cost
+
+        getattr(self, "gold" + sfx)[live] = gold
+        getattr(self, "atk" + sfx)[live] = atk
+        getattr(self, "def" + sfx)[live] = dfn
+        getattr(self, "pending" + sfx)[live] = bought
+        return scout
+
+    # ---------- распределение нейтрала ----------
+    def _allocate_neutral(self, live: np.ndarray) -> None:
+        a1 = self.pending1[live]
+        a2 = self.pending2[live]
+        N = self.neutral[live]
+
+        contested = np.minimum(np.minimum(a1, a2), N)
+        give1 = np.minimum(a1 - contested, N - contested)
+        give2 = np.minimum(a2 - contested, N - contested - give1)
+
+        self.terr1[live] += give1
+        self.exp_total1[live] += give1
+        self.terr2[live] += give2
+        self.exp_total2[live] += give2
+        self.neutral[live] = N - give1 - give2
+
+        self.pending1[live] = 0
+        self.pending2[live] = 0
+
+    # ---------- бой ----------
+    def _resolve_combat(self, live: np.ndarray) -> None:
+        dmg12 = np.maximum(0, self.atk1[live] - self.def2[live])
+        dmg21 = np.maximum(0, self.atk2[live] - self.def1[live])
+
+        loss1 = np.minimum(dmg21, self.terr1[live])
+        loss2 = np.minimum(dmg12, self.terr2[live])
+
+        self.terr1[live] -= loss1
+        self.terr2[live] -= loss2
+        self.neutral[live] += loss1 + loss2
+
+    # ---------- результат ----------
+    def _winner(self, i: int) -> str:
+        t1, t2 = int(self.terr1[i]), int(self.terr2[i])
+        if t1 == 0 and t2 == 0:
+            return "draw"
+        if t1 == 0:
+            return "player2"
+        if t2 == 0:
+            return "player1"
+        g1, g2 = int(self.gold1[i]), int(self.gold2[i])
+        if g1 == g2:
+            return "draw"
+        return "player1" if g1 > g2 else "player2"
+
+    def _result(self, i: int) -> Dict[str, Any]:
+        return {
+            "winner": self._winner(i),
+            "turns": int(self.turns[i]),
+            "neutral": int(self.neutral[i]),
+            "p1": {
+                "territory": int(self.terr1[i]),
+                "gold": int(self.gold1[i]),
+                "attack": int(self.atk1[i]),
+                "defense": int(self.def1[i]),
+            },
+            "p2": {
+                "territory": int(self.terr2[i]),
+                "gold": int(self.gold2[i]),
+                "attack": int(self.atk2[i]),
+                "defense": int(self.def2[i]),
+            },
+        }
+
+
+def run_many(
+    strat_factory_a: StratFactory,
+    strat_factory_b: StratFactory,
+    n_matches: int,
+    *,
+    game_settings: GameSettings | None = None,
+) -> List[Dict[str, Any]]:
+    """Сыграть *n_matches* матчей A vs B и вернуть список результатов `Engine.run()`.
+
+    Меньше `MIN_BATCH` матчей играются последовательно через `Engine`.
+    """
+    if n_matches < MIN_BATCH:
+        return [
+            Engine(strat_factory_a(), strat_factory_b(), trace=None, game_settings=game_settings).run()
+            for _ in range(n_matches)
+        ]
+    return BatchEngine(
+        strat_factory_a, strat_factory_b, n_matches, game_settings=game_settings
+    ).run()
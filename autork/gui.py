@@ -9,6 +9,7 @@
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
@@ -39,6 +40,19 @@ class GuiEngine(Engine):
     DOWN_RED = (220, 60, 60)
 
     FONT_MAIN = "DejaVu Sans"  # содержит стрелки ↑ ↓ →
+    TEXT_CACHE_SIZE = 256      # сколько отрисованных надписей держать в кэше
+
+    # --- инфо‑панель ---
+    PANEL_BG = (40, 40, 40)
+    PANEL_PAD = 8
+    PANEL_LINE_H = 26
+    PANEL_LABELS = ("Территория:", "Атака:", "Защита:")
+
+    # --- полосы‑отношения ---
+    REL_BAR_H = 30     # толщина полосы (и размер иконок)
+    REL_ICON_PAD = 6   # отступ между иконкой и полосой
+    REL_GAP = 40       # полоса под подпись над каждой шкалой
+    REL_ICONS = ("blue_sword", "red_sword", "blue_shield", "red_shield")
 
     def __init__(self, strat1, strat2, cfg=None, fps=7):
         if cfg is None:
@@ -51,16 +65,43 @@ class GuiEngine(Engine):
         self.font = pygame.font.SysFont(self.FONT_MAIN, 20)
         self.font_small = pygame.font.SysFont(self.FONT_MAIN, 16)
         self.font_big = pygame.font.SysFont(self.FONT_MAIN, 26, bold=True)
+        # кэш растеризованных надписей: (текст, цвет, шрифт) -> Surface
+        self._text_surface = lru_cache(maxsize=self.TEXT_CACHE_SIZE)(self._render_text_surface)
+        # статичная «обвязка» панелей игроков рисуется один раз
+        self._panel_bg_left = self._build_panel_bg("Игрок 1")
+        self._panel_bg_right = self._build_panel_bg("Игрок 2")
+        self._panel_value_dx = [self.font.size(label)[0] for label in self.PANEL_LABELS]
+        # иконки полос‑отношений, уже отмасштабированные: {высота: {имя: Surface}}
+        self._rel_icons = {self.REL_BAR_H: self._load_rel_icons(self.REL_BAR_H)}
+        # геометрия полос‑отношений зависит только от раскладки окна
+        icon_w = self.REL_BAR_H  # иконки квадратные, высотой с полосу
+        x_icon_left = self.MARGIN + self.PANEL_W + self.MARGIN
+        x_icon_right = self.WIDTH - self.MARGIN - self.PANEL_W - self.MARGIN - icon_w
+        bar_x = x_icon_left + icon_w + self.REL_ICON_PAD
+        self._bar_geom = {
+            "x_icon_left": x_icon_left,
+            "x_icon_right": x_icon_right,
+            "bar_x": bar_x,
+            "bar_w": x_icon_right - self.REL_ICON_PAD - bar_x,
+        }
         # для подсчёта изменения золота
         self._prev_gold: Tuple[int, int] = (self.p1.gold, self.p2.gold)
-        self.clock = pygame.time.Clock()
         self.fps = fps
+        # время (мс) показа последнего кадра – от него отсчитывается следующий
+        self._frame_shown = 0
+        # области экрана, изменённые за кадр (для pygame.display.update)
+        self._dirty: list[pygame.Rect] = []
+        self._full_frame = True
 
     # -------------------------------------------------- GUI helpers
+    @staticmethod
+    def _render_text_surface(txt, color, font):
+        return font.render(txt, True, color)
+
     def _draw_text(self, txt, pos, color=WHITE, center=False, font=None):
         if font is None:
             font = self.font
-        surf = font.render(txt, True, color)
+        surf = self._text_surface(txt, color, font)
         rect = surf.get_rect()
         if center:
             rect.center = pos
@@ -69,34 +110,58 @@ class GuiEngine(Engine):
         self.screen.blit(surf, rect)
         return rect
 
+    def _build_panel_bg(self, head: str) -> pygame.Surface:
+        """Фон, рамка, заголовок и подписи панели игрока (без чисел)."""
+        surf = pygame.Surface((self.PANEL_W, self.HEIGHT - self.BAR_H - 2 * self.MARGIN)).convert()
+        surf.fill(self.PANEL_BG)
+        pygame.draw.rect(surf, self.WHITE, surf.get_rect(), 1)
+        pad, line_h = self.PANEL_PAD, self.PANEL_LINE_H
+        surf.blit(self.font_big.render(head, True, self.WHITE), (pad, pad))
+        for i, label in enumerate(self.PANEL_LABELS, start=1):
+            surf.blit(self.font.render(label, True, self.WHITE), (pad, pad + i * line_h))
+        return surf
+
+    def _load_rel_icons(self, size: int):
+        """Загрузить иконки меча/щита и привести их к размеру *size*×*size*."""
+        here = Path(__file__).parent
+
+        def _load(name: str):
+            path = here / name
+            if path.exists():
+                try:
+                    img = pygame.image.load(str(path))
+                    return pygame.transform.scale(img, (size, size)).convert_alpha()
+                except Exception:
+                    pass
+            # Заглушка, если файла нет – пустой квадрат; прозрачность через
+            # colorkey (быстрый blit), а не попиксельную альфу
+            surf = pygame.Surface((size, size))
+            surf.fill((0, 0, 0))
+            surf.set_colorkey((0, 0, 0))
+            pygame.draw.rect(surf, self.GREY, (0, 0, size, size), 2)
+            return surf.convert()
+
+        return {name: _load(f"{name}.png") for name in self.REL_ICONS}
+
     def _draw_player_panel(self, pl, x, y, delta_gold, is_left: bool):
-        panel_rect = pygame.Rect(x, y, self.PANEL_W, self.HEIGHT - self.BAR_H - 2 * self.MARGIN)
-        pygame.draw.rect(self.screen, (40, 40, 40), panel_rect)
-        pygame.draw.rect(self.screen, self.WHITE, panel_rect, 1)
-
-        pad = 8
-        line_y = y + pad
-        align = "left" if is_left else "right"
-        def line(text, color=self.WHITE, font=None):
-            nonlocal line_y
-            if align == "left":
-                pos = (x + pad, line_y)
-            else:
-                pos = (x + pad, line_y)
-            self._draw_text(text, pos, color, center=False, font=font)
-            line_y += 26
+        bg = self._panel_bg_left if is_left else self._panel_bg_right
+        pad, line_h = self.PANEL_PAD, self.PANEL_LINE_H
+        if self._full_frame:
+            self._dirty.append(self.screen.blit(bg, (x, y)))
+        else:
+            # меняются только строки с числами – восстанавливаем фон под ними
+            area = pygame.Rect(1, pad + line_h, self.PANEL_W - 2, 4 * line_h)
+            self._dirty.append(self.screen.blit(bg, (x + area.x, y + area.y), area))
+
+        values = (pl.territory, pl.attack, pl.defense)
+        for i, (dx, value) in enumerate(zip(self._panel_value_dx, values), start=1):
+            self._draw_text(f" {value}", (x + pad + dx, y + pad + i * line_h))
 
         arrow = "↑" if delta_gold > 0 else ("↓" if delta_gold < 0 else "→")
         arrow_color = self.GREEN if delta_gold > 0 else (self.DOWN_RED if delta_gold < 0 else self.WHITE)
-
-        head = f"Игрок {'1' if is_left else '2'}"
-        line(head, font=self.font_big)
-        line(f"Территория: {pl.territory}")
-        line(f"Атака: {pl.attack}")
-        line(f"Защита: {pl.defense}")
-        # золото + дельта
+        # золото + дельта (цвет строки зависит от дельты – рисуется целиком)
         gold_txt = f"Золото: {pl.gold} {arrow}{abs(delta_gold)}"
-        line(gold_txt, arrow_color)
+        self._draw_text(gold_txt, (x + pad, y + pad + 4 * line_h), arrow_color)
 
     def _draw_relation_bar(self, numerator: int, denominator: int, caption: str, top_y: int) -> int:
         """Толстая цветная полоса‑отношение с иконками.
@@ -106,34 +171,10 @@ class GuiEngine(Engine):
         * Разделитель определяется отношением (num/denom) ограниченным [0;2].
         * Возвращает y‑координату для следующего блока.
         """
-        # ---------------- загружаем иконки лениво ----------------
-        bar_h = 30  # толщина полосы
-        icon_pad = 6  # отступ между иконкой и полосой
-        if not hasattr(self, "_rel_icons"):
-            here = Path(__file__).parent
-
-            def _load(name: str):
-                path = here / name
-                if path.exists():
-                    try:
-                        return pygame.image.load(str(path)).convert_alpha()
-                    except Exception:
-                        pass
-                # Заглушка, если файла нет – рисуем пустой квадрат
-                surf = pygame.Surface((32, 32), pygame.SRCALPHA)
-                pygame.draw.rect(surf, self.GREY, (0, 0, 32, 32), 2)
-                return surf
-
-            raw = {
-                "blue_sword": _load("blue_sword.png"),
-                "red_sword": _load("red_sword.png"),
-                "blue_shield": _load("blue_shield.png"),
-                "red_shield": _load("red_shield.png"),
-            }
-            # Масштабируем до высоты полосы
-            self._rel_icons = {k: pygame.transform.smoothscale(img, (bar_h, bar_h)) for k, img in raw.items()}
-
-        icons = self._rel_icons
+        bar_h = self.REL_BAR_H
+        icons = self._rel_icons[bar_h]
+        geom = self._bar_geom
+        bar_x, bar_w = geom["bar_x"], geom["bar_w"]
         # ---------------- определяем иконки для данного caption ----------------
         if "Atk₁" in caption:
             left_icon = icons["blue_sword"]
@@ -142,19 +183,13 @@ class GuiEngine(Engine):
             left_icon = icons["blue_shield"]
             right_icon = icons["red_sword"]
 
-        # ---------------- геометрия ----------------
-        icon_w = left_icon.get_width()
-        left_panel_end = self.MARGIN + self.PANEL_W
-        right_panel_start = self.WIDTH - self.MARGIN - self.PANEL_W
-
-        x_icon_left = left_panel_end + self.MARGIN
-        x_icon_right = right_panel_start - self.MARGIN - icon_w
-
-        bar_x = x_icon_left + icon_w + icon_pad
-        bar_w = x_icon_right - icon_pad - bar_x
+        # подпись над полосой перерисовывается на чистом фоне
+        self.screen.fill(self.BACKGROUND, (bar_x, top_y - self.REL_GAP, bar_w, self.REL_GAP))
+        self._dirty.append(pygame.Rect(bar_x, top_y - self.REL_GAP, bar_w, self.REL_GAP + bar_h))
 
         # фон (серый рамкой, затем рисуем цветные сегменты)
-        pygame.draw.rect(self.screen, self.GREY, (bar_x, top_y, bar_w, bar_h))
+        # сплошные заливки – Surface.fill, рамки – draw.rect
+        self.screen.fill(self.GREY, (bar_x, top_y, bar_w, bar_h))
 
         # считаем позицию разделителя
         if denominator == 0:
@@ -164,20 +199,21 @@ class GuiEngine(Engine):
         ratio = max(0.0, min(2.0, ratio))  # clamp 0..2
         pos_x = bar_x + (ratio / 2.0) * bar_w
         # цветные сегменты
-        pygame.draw.rect(self.screen, self.BLUE, (bar_x, top_y, int(pos_x - bar_x), bar_h))
-        pygame.draw.rect(self.screen, self.RED, (int(pos_x), top_y, int(bar_x + bar_w - pos_x), bar_h))
+        self.screen.fill(self.BLUE, (bar_x, top_y, int(pos_x - bar_x), bar_h))
+        self.screen.fill(self.RED, (int(pos_x), top_y, int(bar_x + bar_w - pos_x), bar_h))
         # рамка
         pygame.draw.rect(self.screen, self.WHITE, (bar_x, top_y, bar_w, bar_h), 1)
 
-        # иконки
-        self.screen.blit(left_icon, (x_icon_left, top_y))
-        self.screen.blit(right_icon, (x_icon_right, top_y))
+        # иконки статичны – только в полном кадре
+        if self._full_frame:
+            self._dirty.append(self.screen.blit(left_icon, (geom["x_icon_left"], top_y)))
+            self._dirty.append(self.screen.blit(right_icon, (geom["x_icon_right"], top_y)))
 
         # подпись сверху (по центру полосы)
         caption_text = f"{caption}: {numerator}/{denominator if denominator else '∞'}"
         self._draw_text(caption_text, (bar_x + bar_w // 2, top_y - 24), center=True)
 
-        return top_y + bar_h + 40  # смещение для следующего блока
+        return top_y + bar_h + self.REL_GAP  # смещение для следующего блока
 
     def _draw_territory_bar(self):
         y = self.HEIGHT - self.BAR_H - self.MARGIN
@@ -191,11 +227,11 @@ class GuiEngine(Engine):
         w_neu = int(w * self.neutral_territory / total)
         w2 = w - w1 - w_neu
         # прямоугольники
-        pygame.draw.rect(self.screen, self.BLUE, (x, y, w1, self.BAR_H))
-        pygame.draw.rect(self.screen, self.GREY, (x + w1, y, w_neu, self.BAR_H))
-        pygame.draw.rect(self.screen, self.RED, (x + w1 + w_neu, y, w2, self.BAR_H))
+        self.screen.fill(self.BLUE, (x, y, w1, self.BAR_H))
+        self.screen.fill(self.GREY, (x + w1, y, w_neu, self.BAR_H))
+        self.screen.fill(self.RED, (x + w1 + w_neu, y, w2, self.BAR_H))
         # граница
-        pygame.draw.rect(self.screen, self.WHITE, (x, y, w, self.BAR_H), 1)
+        self._dirty.append(pygame.draw.rect(self.screen, self.WHITE, (x, y, w, self.BAR_H), 1))
         # подписи
         cx1 = x + w1 // 2
         cx_neu = x + w1 + w_neu // 2
@@ -209,7 +245,7 @@ class GuiEngine(Engine):
 
     # -------------------------------------------------- главная функция отрисовки
     def _render(self):
-        """Полная перерисовка кадра после хода."""
+        """Перерисовка кадра после хода."""
         # расчёт дельты золота для стрелочек
         delta1 = self.p1.gold - self._prev_gold[0]
         delta2 = self.p2.gold - self._prev_gold[1]
@@ -217,7 +253,10 @@ class GuiEngine(Engine):
 
         # заголовок окна
         pygame.display.set_caption(f"Игра – ход {self.turn}")
-        self.screen.fill(self.BACKGROUND)
+        # первый кадр матча рисуется целиком, дальше – только изменившиеся области
+        self._full_frame = self.turn == 0
+        if self._full_frame:
+            self.screen.fill(self.BACKGROUND)
 
         # панели игроков (слева / справа)
         self._draw_player_panel(self.p1, self.MARGIN, self.MARGIN, delta1, is_left=True)
@@ -231,16 +270,27 @@ class GuiEngine(Engine):
         # нижняя карта‑полоса
         self._draw_territory_bar()
 
-        pygame.display.flip()
-        self.clock.tick(self.fps)
+        if self._full_frame:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._dirty)
+        self._dirty.clear()
+        self._frame_shown = pygame.time.get_ticks()
 
     def _handle_gui_events(self):
-        running = True
+        """Выдержать темп *fps*; ``False`` – окно закрыто.
+
+        Пауза между кадрами – блокирующий `pygame.event.wait`: процесс спит,
+        а не опрашивает очередь событий, но закрытие окна видно сразу.
+        """
+        deadline = self._frame_shown + 1000 // self.fps
+        while (left := deadline - pygame.time.get_ticks()) > 0:
+            if pygame.event.wait(left).type == pygame.QUIT:
+                return False
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                running = False
-                break
-        return running
+                return False
+        return True
 
     # -------------------------------------------------- переопределяем run()
     # def run(self):  # type: ignore[override]
@@ -279,7 +329,12 @@ class GuiEngine(Engine):
     #     return self._result(is_end=True)
 
     def _final_render(self):
-        pygame.time.wait(3000)
+        # показываем финальную позицию ещё 3 сек., не нагружая CPU:
+        # блокирующее ожидание событий, окно можно закрыть раньше
+        deadline = pygame.time.get_ticks() + 3000
+        while (left := deadline - pygame.time.get_ticks()) > 0:
+            if pygame.event.wait(left).type == pygame.QUIT:
+                break
         pygame.quit()
 
 # -------------------------------------------------- точка входа: python -m autork.gui
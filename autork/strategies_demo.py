@@ -12,17 +12,20 @@ from __future__ import annotations
 Каждый класс наследует :class:`Strategy` и принимает параметры через `__init__`.
 """
 
-from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 # Предполагаем, что базовый интерфейс Strategy расположен здесь
-from autork.strategy import Strategy  # type: ignore
+from autork.strategy import Action, Strategy  # type: ignore
+
+# Гиперпараметры стратегий – слоты экземпляра, а не ClassVar: их задаёт
+# StratEntry.kwargs, а на CPython 3.11 чтение слота специализируется
+# (LOAD_ATTR_SLOT), тогда как атрибут класса через экземпляр без __dict__ –
+# нет и читается примерно на треть медленнее.
 
 # ---------------------------------------------------------------------------
 #                         U L T R A   A G G R E S S I V E
 # ---------------------------------------------------------------------------
 
-@dataclass
 class UltraAggressiveStrategy(Strategy):
     """Сверх‑агрессивная rush‑стратегия.
 
@@ -40,60 +43,79 @@ class UltraAggressiveStrategy(Strategy):
 
     sname = 'ultra_aggressive'  # имя стратегии
 
-    reserve_gold: int = 0
-    attack_fraction: float = 0.9
-    expand_first_n: int = 1
-    scout_every: int = 0
-
-    _turn: int = 0
-    _expanded: int = 0
+    __slots__ = (
+        "reserve_gold",
+        "attack_fraction",
+        "expand_first_n",
+        "scout_every",
+        "_turn",
+        "_scout_cd",
+        "_expanded",
+    )
+
+    def __init__(
+        self,
+        *,
+        reserve_gold: int = 0,
+        attack_fraction: float = 0.9,
+        expand_first_n: int = 1,
+        scout_every: int = 0,
+    ) -> None:
+        self.reserve_gold = reserve_gold
+        self.attack_fraction = attack_fraction
+        self.expand_first_n = expand_first_n
+        self.scout_every = scout_every
+
+        self._turn: int = 0
+        self._scout_cd: int = scout_every  # ходов до следующей разведки
+        self._expanded: int = 0
 
     # ------------------------------------------------------------------ API
     def reset(self, initial_observation: Dict[str, Any]) -> None:  # noqa: D401
+        if not self._turn:  # ещё не ходил – состояние и так начальное
+            return
         self._turn = 0
+        self._scout_cd = self.scout_every
         self._expanded = 0
 
-    def step(self, obs: Dict[str, Any]) -> Dict[str, Any]:  # noqa: D401
+    def step(self, obs: Dict[str, Any]) -> Action:  # noqa: D401
         self._turn += 1
         gold: int = obs["my"]["gold"]
         neutral: int = obs["neutral_territory"]
         prices = obs["prices"]
+        p_scout = prices.get("scout", 0)
+        p_expand = prices.get("expand_next", 0)
 
-        cmd: Dict[str, Any] = {
-            "expand": 0,
-            "spend_attack": 0,
-            "spend_defense": 0,
-            "sell_attack": 0,
-            "sell_defense": 0,
-            "scout": False,
-        }
+        expand = 0
+        scout = False
 
         # --- разведка ---
-        if self.scout_every and self._turn % self.scout_every == 0 and gold >= prices.get("scout", 0):
-            cmd["scout"] = True
-            gold -= prices.get("scout", 0)
+        self._scout_cd -= 1
+        if not self._scout_cd:  # при scout_every == 0 счётчик уходит в минус
+            self._scout_cd = self.scout_every
+            if gold >= p_scout:
+                scout = True
+                gold -= p_scout
 
         # --- ранняя экспансия ---
         if (
             self._expanded < self.expand_first_n
             and neutral > 0
-            and gold >= prices.get("expand_next", 0)
+            and gold >= p_expand
         ):
-            cmd["expand"] = 1
-            gold -= prices.get("expand_next", 0)
+            expand = 1
+            gold -= p_expand
             self._expanded += 1
 
         # --- rush‑атака ---
         spend_attack = max(0, int((gold - self.reserve_gold) * self.attack_fraction))
-        cmd["spend_attack"] = spend_attack
-        return cmd
+        return Action(expand=expand, spend_attack=spend_attack, scout=scout)
 
 
 # ---------------------------------------------------------------------------
 #                         U L T R A   D E F E N S I V E
 # ---------------------------------------------------------------------------
 
-@dataclass
 class UltraDefensiveStrategy(Strategy):
     """Сверх‑оборонительная стратегия («черепаха»).
 
@@ -111,119 +133,153 @@ class UltraDefensiveStrategy(Strategy):
 
     sname = "ultra_defensive"  # имя стратегии
 
-    defense_floor: int = 20
-    defense_focus_turns: int = 15
-    save_for_upkeep: int = 5
-    expand_budget_ratio: float = 0.4
+    __slots__ = (
+        "defense_floor",
+        "defense_focus_turns",
+        "save_for_upkeep",
+        "expand_budget_ratio",
+        "_turn",
+    )
 
-    _turn: int = 0
+    def __init__(
+        self,
+        *,
+        defense_floor: int = 20,
+        defense_focus_turns: int = 15,
+        save_for_upkeep: int = 5,
+        expand_budget_ratio: float = 0.4,
+    ) -> None:
+        self.defense_floor = defense_floor
+        self.defense_focus_turns = defense_focus_turns
+        self.save_for_upkeep = save_for_upkeep
+        self.expand_budget_ratio = expand_budget_ratio
+
+        self._turn: int = 0
 
     def reset(self, initial_observation: Dict[str, Any]) -> None:  # noqa: D401
+        if not self._turn:  # ещё не ходил – состояние и так начальное
+            return
         self._turn = 0
 
-    def step(self, obs: Dict[str, Any]) -> Dict[str, Any]:  # noqa: D401
+    def step(self, obs: Dict[str, Any]) -> Action:  # noqa: D401
         self._turn += 1
-        gold: int = obs["my"]["gold"]
-        my_def: int = obs["my"]["defense"]
+        my = obs["my"]
+        gold: int = my["gold"]
+        my_def: int = my["defense"]
         neutral: int = obs["neutral_territory"]
         prices = obs["prices"]
+        p_expand = prices.get("expand_next", 0)
+        p_defense = prices.get("buy_defense", 0)
 
-        cmd: Dict[str, Any] = {
-            "expand": 0,
-            "spend_attack": 0,
-            "spend_defense": 0,
-            "sell_attack": 0,
-            "sell_defense": 0,
-            "scout": False,
-        }
+        expand = 0
+        spend_defense = 0
 
         # --- приоритет: довести защиту до порога ---
         if my_def < self.defense_floor or self._turn <= self.defense_focus_turns:
             invest = max(0, gold - self.save_for_upkeep)
             if invest:
-                cmd["spend_defense"] = invest
+                spend_defense = invest
                 gold -= invest
 
         # --- экспансия за счёт доли бюджета ---
-        if neutral > 0 and gold > prices.get("expand_next", 0):
+        if neutral > 0 and gold > p_expand:
             budget = int(gold * self.expand_budget_ratio)
             cells = budget // prices.get("expand_next", 1)
             if cells:
-                cmd["expand"] = cells
-                gold -= cells * prices.get("expand_next", 0)
+                expand = cells
+                gold -= cells * p_expand
 
         # --- остаток тоже в защиту, если превышает резерв ---
-        if gold - self.save_for_upkeep >= prices.get("buy_defense", 0):
-            cmd["spend_defense"] += gold - self.save_for_upkeep
-        return cmd
+        if gold - self.save_for_upkeep >= p_defense:
+            spend_defense += gold - self.save_for_upkeep
+        return Action(expand=expand, spend_defense=spend_defense)
 
 
 # ---------------------------------------------------------------------------
 #                             E C O N O M I C   B O O M
 # ---------------------------------------------------------------------------
 
-@dataclass
 class EconomicBoomStrategy(Strategy):
     """Экономическая стратегия: агрессивное расширение → баланс атака/защита."""
     sname = "economic_boom"  # имя стратегии
 
-    neutral_threshold: int = 2
-    expand_ratio: float = 0.6
-    min_defense: int = 10
-    balance_ratio: float = 0.3  # доля оставшегося золота на атаку
-    scout_after_turn: int = 25
+    __slots__ = (
+        "neutral_threshold",
+        "expand_ratio",
+        "min_defense",
+        "balance_ratio",
+        "scout_after_turn",
+        "_turn",
+    )
 
-    _turn: int = 0
+    def __init__(
+        self,
+        *,
+        neutral_threshold: int = 2,
+        expand_ratio: float = 0.6,
+        min_defense: int = 10,
+        balance_ratio: float = 0.3,
+        scout_after_turn: int = 25,
+    ) -> None:
+        self.neutral_threshold = neutral_threshold
+        self.expand_ratio = expand_ratio
+        self.min_defense = min_defense
+        self.balance_ratio = balance_ratio  # доля оставшегося золота на атаку
+        self.scout_after_turn = scout_after_turn
+
+        self._turn: int = 0
 
     def reset(self, initial_observation: Dict[str, Any]) -> None:  # noqa: D401
+        if not self._turn:  # ещё не ходил – состояние и так начальное
+            return
         self._turn = 0
 
-    def step(self, obs: Dict[str, Any]) -> Dict[str, Any]:  # noqa: D401
+    def step(self, obs: Dict[str, Any]) -> Action:  # noqa: D401
         self._turn += 1
-        gold: int = obs["my"]["gold"]
-        my_def: int = obs["my"]["defense"]
+        my = obs["my"]
+        gold: int = my["gold"]
+        my_def: int = my["defense"]
         neutral: int = obs["neutral_territory"]
         prices = obs["prices"]
+        p_scout = prices.get("scout", 0)
+        p_expand = prices.get("expand_next", 0)
+        p_defense = prices.get("buy_defense", 0)
 
-        cmd: Dict[str, Any] = {
-            "expand": 0,
-            "spend_attack": 0,
-            "spend_defense": 0,
-            "sell_attack": 0,
-            "sell_defense": 0,
-            "scout": False,
-        }
+        expand = 0
+        scout = False
 
         # --- периодическая разведка ---
-        if self._turn >= self.scout_after_turn and gold >= prices.get("scout", 0):
-            cmd["scout"] = True
-            gold -= prices.get("scout", 0)
+        if self._turn >= self.scout_after_turn and gold >= p_scout:
+            scout = True
+            gold -= p_scout
 
         # --- Этап 1: расширение ---
         if neutral > self.neutral_threshold:
             budget = int(gold * self.expand_ratio)
             cells = budget // prices.get("expand_next", 1)
             if cells:
-                cmd["expand"] = max(1, cells)
-                gold -= cells * prices.get("expand_next", 0)
+                expand = max(1, cells)
+                gold -= cells * p_expand
 
             # минимальная защита
-            if my_def < self.min_defense and gold >= prices.get("buy_defense", 0):
-                cmd["spend_defense"] = gold
-                return cmd
+            if my_def < self.min_defense and gold >= p_defense:
+                return Action(expand=expand, spend_defense=gold, scout=scout)
 
         # --- Этап 2: баланс атака/защита ---
         spend_attack = int(gold * self.balance_ratio)
-        cmd["spend_attack"] = spend_attack
-        cmd["spend_defense"] = gold - spend_attack
-        return cmd
+        spend_defense = gold - spend_attack
+        return Action(
+            expand=expand,
+            spend_attack=spend_attack,
+            spend_defense=spend_defense,
+            scout=scout,
+        )
 
 
 # ---------------------------------------------------------------------------
 #                        A D A P T I V E   O P P O N E N T
 # ---------------------------------------------------------------------------
 
-@dataclass
 class AdaptiveOpponentStrategy(Strategy):
     """Гибкая стратегия, реагирующая на параметры оппонента.
 
@@ -236,47 +292,72 @@ class AdaptiveOpponentStrategy(Strategy):
     """
     sname = "adaptive_opponent"  # имя стратегии
 
-    scout_every: int = 4
-    defense_margin: int = 2
-    enemy_def_threshold: int = 5
-    attack_budget_ratio: float = 0.2
+    __slots__ = (
+        "scout_every",
+        "defense_margin",
+        "enemy_def_threshold",
+        "attack_budget_ratio",
+        "_turn",
+        "_scout_cd",
+    )
 
-    _turn: int = 0
+    def __init__(
+        self,
+        *,
+        scout_every: int = 4,
+        defense_margin: int = 2,
+        enemy_def_threshold: int = 5,
+        attack_budget_ratio: float = 0.2,
+    ) -> None:
+        self.scout_every = scout_every
+        self.defense_margin = defense_margin
+        self.enemy_def_threshold = enemy_def_threshold
+        self.attack_budget_ratio = attack_budget_ratio
+
+        self._turn: int = 0
+        self._scout_cd: int = scout_every  # ходов до следующей разведки
 
     def reset(self, initial_observation: Dict[str, Any]) -> None:  # noqa: D401
+        if not self._turn:  # ещё не ходил – состояние и так начальное
+            return
         self._turn = 0
+        self._scout_cd = self.scout_every
 
-    def step(self, obs: Dict[str, Any]) -> Dict[str, Any]:  # noqa: D401
+    def step(self, obs: Dict[str, Any]) -> Action:  # noqa: D401
         self._turn += 1
-        gold: int = obs["my"]["gold"]
-        my_def: int = obs["my"]["defense"]
+        my = obs["my"]
+        gold: int = my["gold"]
+        my_def: int = my["defense"]
         neutral: int = obs["neutral_territory"]
         prices = obs["prices"]
+        p_scout = prices.get("scout", 0)
+        p_expand = prices.get("expand_next", 0)
+        p_defense = prices.get("buy_defense", 0)
 
-        enemy_attack: int = obs["enemy"]["attack"]
-        enemy_def: int = obs["enemy"]["defense"]
+        enemy = obs["enemy"]
+        enemy_attack: int = enemy["attack"]
+        enemy_def: int = enemy["defense"]
 
-        cmd: Dict[str, Any] = {
-            "expand": 0,
-            "spend_attack": 0,
-            "spend_defense": 0,
-            "sell_attack": 0,
-            "sell_defense": 0,
-            "scout": False,
-        }
+        expand = 0
+        spend_attack = 0
+        spend_defense = 0
+        scout = False
 
         # --- периодическая разведка ---
-        if self.scout_every and self._turn % self.scout_every == 0 and gold >= prices.get("scout", 0):
-            cmd["scout"] = True
-            gold -= prices.get("scout", 0)
+        self._scout_cd -= 1
+        if not self._scout_cd:  # при scout_every == 0 счётчик уходит в минус
+            self._scout_cd = self.scout_every
+            if gold >= p_scout:
+                scout = True
+                gold -= p_scout
 
         # --- обеспечить нужный уровень защиты ---
         desired_def = enemy_attack + self.defense_margin
-        if my_def < desired_def and gold >= prices.get("buy_defense", 0):
+        if my_def < desired_def and gold >= p_defense:
             # Сколько очков защиты нужно купить (1 золото → 1 защита)
             need = desired_def - my_def
             invest = min(need, gold)
-            cmd["spend_defense"] = invest
+            spend_defense = invest
             gold -= invest
             my_def += invest
 
@@ -284,19 +365,22 @@ class AdaptiveOpponentStrategy(Strategy):
         if enemy_def <= self.enemy_def_threshold and gold > 0:
             atk_budget = int(gold * self.attack_budget_ratio)
             if atk_budget:
-                cmd["spend_attack"] = atk_budget
+                spend_attack = atk_budget
                 gold -= atk_budget
 
         # --- развитие: захват нейтрала оставшимися средствами ---
-        if neutral > 0 and gold >= prices.get("expand_next", 0):
+        if neutral > 0 and gold >= p_expand:
             cells = gold // prices.get("expand_next", 1)
             if cells:
-                cmd["expand"] = cells
-                gold -= cells * prices.get("expand_next", 0)
+                expand = cells
 
-        return cmd
+        return Action(
+            expand=expand,
+            spend_attack=spend_attack,
+            spend_defense=spend_defense,
+            scout=scout,
+        )
     
-@dataclass
 class AdaptiveOpponentStrategyV2(Strategy):
     """Продвинутая стратегия, оценивающая силу врага двумя способами:
 
@@ -311,27 +395,59 @@ class AdaptiveOpponentStrategyV2(Strategy):
     """
     sname = "adaptive_opponent_v2"  # имя стратегии
 
-    # --- настройки тактики ---
-    scout_every: int = 4  # период разведки
-    defense_margin: int = 2  # сколько очков сверху держать
-    enemy_def_threshold: int = 5  # считать оборону врага слабой
-    attack_budget_ratio: float = 0.2  # доля остатка золота на атаку (если враг слаб)
-    expand_floor_pct: int = 40  # % бюджета, который обязательно идёт на экспансию
-
-    # --- настройки инференса урона ---
-    infer_alpha: float = 0.5  # EMA сглаживание наблюд. урона
-    defense_loss_weight: float = 1.0  # вклад потери защиты в оценку атаки
-    territory_loss_weight: float = 1.0  # вклад потери клеток
-
-    # --- внутреннее состояние ---
-    _turn: int = 0
-    _prev_def: Optional[int] = None
-    _prev_land: Optional[int] = None
-    _ema_obs_attack: float = 0.0
+    __slots__ = (
+        "scout_every",
+        "defense_margin",
+        "enemy_def_threshold",
+        "attack_budget_ratio",
+        "expand_floor_pct",
+        "infer_alpha",
+        "defense_loss_weight",
+        "territory_loss_weight",
+        "_turn",
+        "_scout_cd",
+        "_prev_def",
+        "_prev_land",
+        "_ema_obs_attack",
+    )
+
+    def __init__(
+        self,
+        *,
+        scout_every: int = 4,
+        defense_margin: int = 2,
+        enemy_def_threshold: int = 5,
+        attack_budget_ratio: float = 0.2,
+        expand_floor_pct: int = 40,
+        infer_alpha: float = 0.5,
+        defense_loss_weight: float = 1.0,
+        territory_loss_weight: float = 1.0,
+    ) -> None:
+        # --- настройки тактики ---
+        self.scout_every = scout_every  # период разведки
+        self.defense_margin = defense_margin  # сколько очков сверху держать
+        self.enemy_def_threshold = enemy_def_threshold  # считать оборону врага слабой
+        self.attack_budget_ratio = attack_budget_ratio  # доля остатка золота на атаку (если враг слаб)
+        self.expand_floor_pct = expand_floor_pct  # % бюджета, который обязательно идёт на экспансию
+
+        # --- настройки инференса урона ---
+        self.infer_alpha = infer_alpha  # EMA сглаживание наблюд. урона
+        self.defense_loss_weight = defense_loss_weight  # вклад потери защиты в оценку атаки
+        self.territory_loss_weight = territory_loss_weight  # вклад потери клеток
+
+        # --- внутреннее состояние ---
+        self._turn: int = 0
+        self._scout_cd: int = scout_every  # ходов до следующей разведки
+        self._prev_def: Optional[int] = None
+        self._prev_land: Optional[int] = None
+        self._ema_obs_attack: float = 0.0
 
     # ------------------------------------------------------------------ API
     def reset(self, initial_observation: Dict[str, Any]) -> None:  # noqa: D401
+        if not self._turn:  # ещё не ходил – состояние и так начальное
+            return
         self._turn = 0
+        self._scout_cd = self.scout_every
         self._prev_def = None
         self._prev_land = None
         self._ema_obs_attack = 0.0
@@ -351,16 +467,21 @@ class AdaptiveOpponentStrategyV2(Strategy):
             + land_loss * self.territory_loss_weight
         )
 
-    def step(self, obs: Dict[str, Any]) -> Dict[str, Any]:  # noqa: D401
+    def step(self, obs: Dict[str, Any]) -> Action:  # noqa: D401
         self._turn += 1
-        gold: int = obs["my"]["gold"]
-        my_def: int = obs["my"]["defense"]
-        my_land: int = obs["my"].get("territory", 0)
+        my = obs["my"]
+        gold: int = my["gold"]
+        my_def: int = my["defense"]
+        my_land: int = my.get("territory", 0)
         neutral: int = obs.get("neutral_territory", 0)
         prices = obs["prices"]
+        p_scout = prices.get("scout", 0)
+        p_expand = prices.get("expand_next", 0)
+        p_defense = prices.get("buy_defense", 0)
 
-        enemy_attack: int = obs["enemy"]["attack"]
-        enemy_def: int = obs["enemy"]["defense"]
+        enemy = obs["enemy"]
+        enemy_attack: int = enemy["attack"]
+        enemy_def: int = enemy["defense"]
 
         # --- инференс скрытой атаки ---
         observed_attack = self._infer_attack_from_damage(my_def, my_land)
@@ -372,26 +493,25 @@ class AdaptiveOpponentStrategyV2(Strategy):
         # --- итоговая оценка атаки врага ---
         estimated_attack = max(enemy_attack, self._ema_obs_attack)
 
-        cmd: Dict[str, Any] = {
-            "expand": 0,
-            "spend_attack": 0,
-            "spend_defense": 0,
-            "sell_attack": 0,
-            "sell_defense": 0,
-            "scout": False,
-        }
+        expand = 0
+        spend_attack = 0
+        spend_defense = 0
+        scout = False
 
         # --- разведываем при необходимости ---
-        if self.scout_every and self._turn % self.scout_every == 0 and gold >= prices.get("scout", 0):
-            cmd["scout"] = True
-            gold -= prices.get("scout", 0)
+        self._scout_cd -= 1
+        if not self._scout_cd:  # при scout_every == 0 счётчик уходит в минус
+            self._scout_cd = self.scout_every
+            if gold >= p_scout:
+                scout = True
+                gold -= p_scout
 
         # --- обеспечить достаточную защиту ---
         desired_def = int(estimated_attack) + self.defense_margin
-        if my_def < desired_def and gold >= prices.get("buy_defense", 0):
+        if my_def < desired_def and gold >= p_defense:
             need = desired_def - my_def
             invest = min(need, gold)
-            cmd["spend_defense"] = invest
+            spend_defense = invest
             gold -= invest
             my_def += invest  # обновить локальную переменную
 
@@ -399,22 +519,26 @@ class AdaptiveOpponentStrategyV2(Strategy):
         if enemy_def <= self.enemy_def_threshold and gold > 0:
             atk_budget = int(gold * self.attack_budget_ratio)
             if atk_budget > 0:
-                cmd["spend_attack"] = atk_budget
+                spend_attack = atk_budget
                 gold -= atk_budget
 
         # --- минимум на экспансию ---
-        expand_budget_min = int(gold * self.expand_floor_pct / 100)
-        if neutral and gold >= prices.get("expand_next", 0):
+        expand_budget_min = gold * self.expand_floor_pct // 100
+        if neutral and gold >= p_expand:
             cells = expand_budget_min // prices.get("expand_next", 1)
             if cells > 0:
-                cmd["expand"] = cells
-                gold -= cells * prices.get("expand_next", 0)
+                expand = cells
 
         # --- сохранить состояние для следующего шага ---
         self._prev_def = my_def
         self._prev_land = my_land
 
-        return cmd
+        return Action(
+            expand=expand,
+            spend_attack=spend_attack,
+            spend_defense=spend_defense,
+            scout=scout,
+        )
 
 
 
@@ -442,7 +566,6 @@ def _observe_attack(
 #                         U L T R A   D E F E N S I V E   v2
 # ---------------------------------------------------------------------------
 
-@dataclass
 class UltraDefensiveStrategyV2(Strategy):
     """«Черепаха v2»: адаптивная оборонительная стратегия.
 
@@ -457,98 +580,137 @@ class UltraDefensiveStrategyV2(Strategy):
 
     sname = "turtle_v2"  # имя стратегии
 
-    # --- тактические параметры ---
-    def_margin: int = 2
-    overshoot_sell: int = 5   # запас DEF, после которого продаём лишнее
-    enemy_def_weak: int = 4   # порог слабости брони врага
-    atk_budget_ratio: float = 0.15
-    expand_floor_pct: int = 30  # минимум на экспансию
-
-    # --- инференс ---
-    scout_every: int = 6
-    ema_alpha: float = 0.5
-
-    # --- внутреннее состояние ---
-    _turn: int = 0
-    _ema_attack: float = 0.0
-    _prev_def: Optional[int] = None
-    _prev_land: Optional[int] = None
+    __slots__ = (
+        "def_margin",
+        "overshoot_sell",
+        "enemy_def_weak",
+        "atk_budget_ratio",
+        "expand_floor_pct",
+        "scout_every",
+        "ema_alpha",
+        "_turn",
+        "_scout_cd",
+        "_ema_attack",
+        "_prev_def",
+        "_prev_land",
+    )
+
+    def __init__(
+        self,
+        *,
+        def_margin: int = 2,
+        overshoot_sell: int = 5,
+        enemy_def_weak: int = 4,
+        atk_budget_ratio: float = 0.15,
+        expand_floor_pct: int = 30,
+        scout_every: int = 6,
+        ema_alpha: float = 0.5,
+    ) -> None:
+        # --- тактические параметры ---
+        self.def_margin = def_margin
+        self.overshoot_sell = overshoot_sell  # запас DEF, после которого продаём лишнее
+        self.enemy_def_weak = enemy_def_weak  # порог слабости брони врага
+        self.atk_budget_ratio = atk_budget_ratio
+        self.expand_floor_pct = expand_floor_pct  # минимум на экспансию
+
+        # --- инференс ---
+        self.scout_every = scout_every
+        self.ema_alpha = ema_alpha
+
+        # --- внутреннее состояние ---
+        self._turn: int = 0
+        self._scout_cd: int = scout_every  # ходов до следующей разведки
+        self._ema_attack: float = 0.0
+        self._prev_def: Optional[int] = None
+        self._prev_land: Optional[int] = None
 
     # -------------------------------------------------- API
     def reset(self, initial_observation: Dict[str, Any]) -> None:  # noqa: D401
+        if not self._turn:  # ещё не ходил – состояние и так начальное
+            return
         self._turn = 0
+        self._scout_cd = self.scout_every
         self._ema_attack = 0.0
         self._prev_def = None
         self._prev_land = None
 
-    def step(self, obs: Dict[str, Any]) -> Dict[str, Any]:  # noqa: D401
+    def step(self, obs: Dict[str, Any]) -> Action:  # noqa: D401
         self._turn += 1
-        gold: int = obs["my"]["gold"]
-        my_def: int = obs["my"]["defense"]
-        my_land: int = obs["my"]["territory"]
+        my = obs["my"]
+        gold: int = my["gold"]
+        my_def: int = my["defense"]
+        my_land: int = my["territory"]
         neutral: int = obs["neutral_territory"]
         prices = obs["prices"]
+        p_scout = prices["scout"]
+        p_expand = prices["expand_next"]
+        p_attack = prices["buy_attack"]
+        p_defense = prices["buy_defense"]
 
         # --- оценка атаки врага ---
-        enemy_attack_vis = obs["enemy"].get("attack", 0)
+        enemy_get = obs["enemy"].get
+        enemy_attack_vis = enemy_get("attack", 0)
         observed = _observe_attack(self._prev_def, self._prev_land, my_def, my_land)
         self._ema_attack = _ema(self._ema_attack, observed, self.ema_alpha)
         est_attack = max(enemy_attack_vis, self._ema_attack)
 
-        cmd: Dict[str, Any] = {
-            "expand": 0,
-            "spend_attack": 0,
-            "spend_defense": 0,
-            "sell_attack": 0,
-            "sell_defense": 0,
-            "scout": False,
-        }
+        expand = 0
+        spend_attack = 0
+        spend_defense = 0
+        sell_defense = 0
+        scout = False
 
         # --- разведка по таймеру ---
-        if self.scout_every and self._turn % self.scout_every == 0 and gold >= prices["scout"]:
-            cmd["scout"] = True
-            gold -= prices["scout"]
+        self._scout_cd -= 1
+        if not self._scout_cd:  # при scout_every == 0 счётчик уходит в минус
+            self._scout_cd = self.scout_every
+            if gold >= p_scout:
+                scout = True
+                gold -= p_scout
 
         # --- целевой уровень защиты ---
         target_def = int(est_attack) + self.def_margin
         if my_def < target_def:
             need = min(target_def - my_def, gold)
-            cmd["spend_defense"] = need
+            spend_defense = need
             gold -= need
             my_def += need
         else:
             # слишком много защиты? продаём, если не хватает золота
             excess = my_def - target_def
-            if excess > self.overshoot_sell and gold < prices["expand_next"]:
+            if excess > self.overshoot_sell and gold < p_expand:
                 sell_units = min(excess - self.overshoot_sell, my_def // 4)
-                cmd["sell_defense"] = sell_units
-                gold += sell_units * (prices["buy_defense"] // 2)
+                sell_defense = sell_units
+                gold += sell_units * (p_defense // 2)
                 my_def -= sell_units
 
         # --- слабая броня врага → немного атаки ---
-        enemy_def = obs["enemy"].get("defense", 0)
+        enemy_def = enemy_get("defense", 0)
         if enemy_def <= self.enemy_def_weak and gold > 0:
             atk_budget = int(gold * self.atk_budget_ratio)
-            if atk_budget >= prices["buy_attack"]:
-                cmd["spend_attack"] = atk_budget
+            if atk_budget >= p_attack:
+                spend_attack = atk_budget
                 gold -= atk_budget
 
         # --- минимум бюджета на нейтрал ---
-        if neutral and gold >= prices["expand_next"]:
-            to_expand = max(1, int(gold * self.expand_floor_pct / 100) // prices["expand_next"])
-            cmd["expand"] = to_expand
-            gold -= to_expand * prices["expand_next"]
+        if neutral and gold >= p_expand:
+            expand = max(1, gold * self.expand_floor_pct // 100 // p_expand)
 
         # --- сохранить текущие показатели ---
         self._prev_def = my_def
         self._prev_land = my_land
-        return cmd
+        return Action(
+            expand=expand,
+            spend_attack=spend_attack,
+            spend_defense=spend_defense,
+            sell_defense=sell_defense,
+            scout=scout,
+        )
 
 # ---------------------------------------------------------------------------
 #                             E C O N O M I C   B O O M   v2
 # ---------------------------------------------------------------------------
 
-@dataclass
 class EconomicBoomStrategyV2(Strategy):
     """Экономическая стратегия v2: быстрая экспансия с адаптивной обороной.
 
@@ -561,60 +723,94 @@ class EconomicBoomStrategyV2(Strategy):
 
     sname = "economic_boom_v2"  # имя стратегии
 
-    # --- параметры тактики ---
-    def_margin: int = 1
-    scout_every: int = 5
-    expand_ratio: float = 0.75  # fraction of gold to spend on expansion in phase 1
-    post_expand_atk_share: float = 0.6  # после нейтрала доля на атаку
-    sell_attack_threshold: int = 8  # если моя атака настолько превышает броню врага — распродать
-    ema_alpha: float = 0.4
-
-    _turn: int = 0
-    _ema_attack: float = 0.0
-    _prev_def: Optional[int] = None
-    _prev_land: Optional[int] = None
+    __slots__ = (
+        "def_margin",
+        "scout_every",
+        "expand_ratio",
+        "post_expand_atk_share",
+        "sell_attack_threshold",
+        "ema_alpha",
+        "_turn",
+        "_scout_cd",
+        "_ema_attack",
+        "_prev_def",
+        "_prev_land",
+    )
+
+    def __init__(
+        self,
+        *,
+        def_margin: int = 1,
+        scout_every: int = 5,
+        expand_ratio: float = 0.75,
+        post_expand_atk_share: float = 0.6,
+        sell_attack_threshold: int = 8,
+        ema_alpha: float = 0.4,
+    ) -> None:
+        # --- параметры тактики ---
+        self.def_margin = def_margin
+        self.scout_every = scout_every
+        self.expand_ratio = expand_ratio  # fraction of gold to spend on expansion in phase 1
+        self.post_expand_atk_share = post_expand_atk_share  # после нейтрала доля на атаку
+        self.sell_attack_threshold = sell_attack_threshold  # если моя атака настолько превышает броню врага — распродать
+        self.ema_alpha = ema_alpha
+
+        self._turn: int = 0
+        self._scout_cd: int = scout_every  # ходов до следующей разведки
+        self._ema_attack: float = 0.0
+        self._prev_def: Optional[int] = None
+        self._prev_land: Optional[int] = None
 
     # -------------------------------------------------- API
     def reset(self, initial_observation: Dict[str, Any]) -> None:  # noqa: D401
+        if not self._turn:  # ещё не ходил – состояние и так начальное
+            return
         self._turn = 0
+        self._scout_cd = self.scout_every
         self._ema_attack = 0.0
         self._prev_def = None
         self._prev_land = None
 
-    def step(self, obs: Dict[str, Any]) -> Dict[str, Any]:  # noqa: D401
+    def step(self, obs: Dict[str, Any]) -> Action:  # noqa: D401
         self._turn += 1
-        gold: int = obs["my"]["gold"]
-        my_def: int = obs["my"]["defense"]
-        my_atk: int = obs["my"]["attack"]
-        my_land: int = obs["my"]["territory"]
+        my = obs["my"]
+        gold: int = my["gold"]
+        my_def: int = my["defense"]
+        my_atk: int = my["attack"]
+        my_land: int = my["territory"]
         neutral: int = obs["neutral_territory"]
         prices = obs["prices"]
-
-        enemy_attack_vis = obs["enemy"].get("attack", 0)
-        enemy_def_vis = obs["enemy"].get("defense", 0)
+        p_scout = prices["scout"]
+        p_expand = prices["expand_next"]
+        p_attack = prices["buy_attack"]
+        p_defense = prices["buy_defense"]
+
+        enemy_get = obs["enemy"].get
+        enemy_attack_vis = enemy_get("attack", 0)
+        enemy_def_vis = enemy_get("defense", 0)
         observed = _observe_attack(self._prev_def, self._prev_land, my_def, my_land)
         self._ema_attack = _ema(self._ema_attack, observed, self.ema_alpha)
         est_enemy_attack = max(enemy_attack_vis, self._ema_attack)
 
-        cmd: Dict[str, Any] = {
-            "expand": 0,
-            "spend_attack": 0,
-            "spend_defense": 0,
-            "sell_attack": 0,
-            "sell_defense": 0,
-            "scout": False,
-        }
+        expand = 0
+        spend_attack = 0
+        spend_defense = 0
+        sell_attack = 0
+        scout = False
 
         # --- разведка периодически ---
-        if self.scout_every and self._turn % self.scout_every == 0 and gold >= prices["scout"]:
-            cmd["scout"] = True
-            gold -= prices["scout"]
+        self._scout_cd -= 1
+        if not self._scout_cd:  # при scout_every == 0 счётчик уходит в минус
+            self._scout_cd = self.scout_every
+            if gold >= p_scout:
+                scout = True
+                gold -= p_scout
 
         # --- обеспечить минимальную оборону ---
         target_def = int(est_enemy_attack) + self.def_margin
-        if my_def < target_def and gold >= prices["buy_defense"]:
+        if my_def < target_def and gold >= p_defense:
             need = min(target_def - my_def, gold)
-            cmd["spend_defense"] = need
+            spend_defense = need
             gold -= need
             my_def += need
 
@@ -622,32 +818,36 @@ class EconomicBoomStrategyV2(Strategy):
         if neutral > 0:
             # трата на экспансию
             budget_exp = int(gold * self.expand_ratio)
-            cells = budget_exp // prices["expand_next"]
+            cells = budget_exp // p_expand
             if cells > 0:
-                cmd["expand"] = cells
-                gold -= cells * prices["expand_next"]
+                expand = cells
+                gold -= cells * p_expand
 
             # немного атаки, если враг слаб
             if enemy_def_vis and enemy_def_vis < my_atk:
                 atk_budget = min(int(gold * 0.25), gold)
-                if atk_budget >= prices["buy_attack"]:
-                    cmd["spend_attack"] = atk_budget
-                    gold -= atk_budget
+                if atk_budget >= p_attack:
+                    spend_attack = atk_budget
         else:
             # ФАЗА 2: нейтрал кончился → распределяем 60/40
             atk_budget = int(gold * self.post_expand_atk_share)
-            cmd["spend_attack"] = atk_budget
-            cmd["spend_defense"] += gold - atk_budget
-            gold = 0
+            spend_attack = atk_budget
+            spend_defense += gold - atk_budget
 
         # --- распродажа избыточной атаки (экономия на содержании) ---
         if enemy_def_vis and my_atk - enemy_def_vis > self.sell_attack_threshold and my_atk > 0:
             sell_units = (my_atk - enemy_def_vis - self.sell_attack_threshold) // 2
             if sell_units > 0:
-                cmd["sell_attack"] = sell_units
+                sell_attack = sell_units
 
         # --- сохранить историю ---
         self._prev_def = my_def
         self._prev_land = my_land
-        return cmd
+        return Action(
+            expand=expand,
+            spend_attack=spend_attack,
+            spend_defense=spend_defense,
+            sell_attack=sell_attack,
+            scout=scout,
+        )
 
@@ -1,19 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Any, ClassVar, Dict
 import random
 
+from autork.commands import Cmd, Command
+
+# команда на ход в виде кортежа: то же, что autork.commands.Cmd
+Action = Cmd
+_DEFAULT_ACTION = Action()
+
 # ---------- интерфейсы ----------
 class Strategy(ABC):
-    sname = 'base empty'
-    author = 'system'
     """Базовый интерфейс стратегии-бота."""
+    # пустые слоты: наследники с __slots__ обходятся без __dict__
+    __slots__ = ()
+
+    sname: ClassVar[str] = 'base empty'
+    author: ClassVar[str] = 'system'
+
     @abstractmethod
     def reset(self, initial_observation: Dict[str, Any]) -> None: ...
     
     @abstractmethod
-    def step(self, observation: Dict[str, Any]) -> Dict[str, Any]: ...
+    def step(self, observation: Dict[str, Any]) -> Command: ...
 
 # ---------- 2 простых примера ----------
+# варианты хода RandomStrategy: (поле команды, ключ цены)
+_RS_ACTIONS = (('expand', 'expand_next'), ('spend_attack', 'buy_attack'), ('spend_defense', 'buy_defense'))
+_RS_SELL = ('sell_attack', 'sell_defense')
+
+
 class RandomStrategy(Strategy):
     sname = 'random'
     
@@ -21,18 +36,17 @@ class RandomStrategy(Strategy):
     def reset(self, observation): 
         pass
 
-    def step(self, obs):
+    def step(self, obs, _rand=random.randrange, _acts=_RS_ACTIONS, _sell=_RS_SELL):
         prices = obs["prices"]
         gold = obs["limits"]["gold"]
-        whatdo, price_key = random.choice([
-            ('expand', 'expand_next'), ('spend_attack', 'buy_attack'), ('spend_defense', 'buy_defense')])
+        whatdo, price_key = _acts[_rand(3)]
         
         res = {"expand": 0, "spend_attack": 0, "spend_defense": 0, "scout": False}
-        if gold >= prices[price_key]:
-            res[whatdo] = prices[price_key]
+        price = prices[price_key]
+        if gold >= price:
+            res[whatdo] = price
         else:
-            whatdo = random.choice(['sell_attack', 'sell_defense'])
-            res[whatdo] = 1
+            res[_sell[_rand(2)]] = 1
         return res
 
 class GreedyExpansionStrategy(Strategy):
@@ -44,5 +58,4 @@ class GreedyExpansionStrategy(Strategy):
         gold = obs["my"]["gold"]
         neutral = obs["neutral_territory"]
         plan = min(neutral, gold // obs["prices"]["expand_next"])
-        return {"expand": plan, "spend_attack": 0,
-                "spend_defense": 0, "scout": False}
+        return Action(expand=plan)
@@ -0,0 +1,47 @@
+"""autork.tournament – параллельный прогон независимых матчей
+
+Матчи турнира не делят состояние, поэтому раздаются по процессам
+(`ProcessPoolExecutor`): масштабирование почти линейно по числу ядер.
+Фабрики стратегий должны быть picklable – классы стратегий или функции
+уровня модуля (не lambda).
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from .config import GameSettings
+from .engine import Engine
+
+StratFactory = Callable[[], Any]
+
+
+def play_match(
+    pair: Tuple[StratFactory, StratFactory],
+    game_settings: GameSettings | None = None,
+) -> Dict[str, Any]:
+    """Сыграть один матч без логов и вернуть результат `Engine.run()`."""
+    factory_a, factory_b = pair
+    return Engine(factory_a(), factory_b(), trace=None, game_settings=game_settings).run()
+
+
+def run_matches(
+    pairs: Sequence[Tuple[StratFactory, StratFactory]],
+    workers: int | None = None,
+    *,
+    game_settings: GameSettings | None = None,
+) -> List[Dict[str, Any]]:
+    """Сыграть все пары (A, B) из *pairs*; результаты в том же порядке.
+
+    *workers* – число процессов (по умолчанию `os.cpu_count()`);
+    при ``workers == 1`` матчи идут последовательно в текущем процессе.
+    """
+    play = partial(play_match, game_settings=game_settings)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pairs) <= 1:
+        return [play(pair) for pair in pairs]
+    chunksize = max(1, len(pairs) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(play, pairs, chunksize=chunksize))
@@ -18,11 +18,12 @@ import sys
 sys.path.append('.')
 
 import itertools
-from collections import Counter
 from dataclasses import dataclass
 from typing import Type
 
-from autork.engine import Engine  # игровой движок
+import numpy as np
+
+from autork.tournament import run_matches  # параллельный прогон матчей
 from autork.strategies_demo import (  # наши стратегии
     UltraAggressiveStrategy,
     UltraDefensiveStrategy,
@@ -43,6 +44,20 @@ class StratEntry:
     def make(self):
         return self.cls(**(self.kwargs or {}))
 
+    def pooled(self):
+        """Экземпляр из пула текущего процесса (создаётся один раз).
+
+        Повторно использовать можно: `Engine.run()` вызывает `reset()`.
+        """
+        inst = _INST_POOL.get(self.name)
+        if inst is None:
+            inst = _INST_POOL[self.name] = self.make()
+        return inst
+
+
+# пул экземпляров стратегий: имя записи -> стратегия (свой в каждом процессе)
+_INST_POOL: dict[str, object] = {}
+
 
 STRATEGIES: list[StratEntry] = [
     StratEntry("Aggro", UltraAggressiveStrategy),
@@ -56,12 +71,14 @@ STRATEGIES: list[StratEntry] = [
 
 # ---------------------------------------------------------------------------
 
-def play_match(a: StratEntry, b: StratEntry) -> int:
-    """Возвращает 1, если выиграл A, -1 если выиграл B, 0 – ничья."""
-    s1 = a.make()
-    s2 = b.make()
-    game = Engine(s1, s2, trace=None)  # без логов
-    result = game.run()
+# Движок почти симметричен (нейтрал при нехватке сначала уходит игроку 1),
+# поэтому каждая пара по умолчанию играет один матч. True – ещё и реванш
+# с обменом мест.
+SWAP_SEATS = False
+
+
+def match_outcome(result: dict) -> int:
+    """Возвращает 1, если выиграл левый, -1 если правый, 0 – ничья."""
     winner = result["winner"]  # 0 – ничья, 1 – левый, 2 – правый
     if winner == 'player1':
         return 1
@@ -70,24 +87,34 @@ def play_match(a: StratEntry, b: StratEntry) -> int:
     return 0
 
 
+def _award(score: np.ndarray, i: int, j: int, outcome: int) -> None:
+    """Начислить очки записям STRATEGIES[i] (слева) и STRATEGIES[j] (справа)."""
+    if outcome == 1:
+        score[i] += 3
+    elif outcome == -1:
+        score[j] += 3
+    else:
+        score[i] += 1
+        score[j] += 1
+
+
 def main() -> None:
-    score = Counter()
-
-    for a, b in itertools.permutations(STRATEGIES, 2):
-        outcome = play_match(a, b)
-        if outcome == 1:
-            score[a.name] += 3
-        elif outcome == -1:
-            score[b.name] += 3
-        else:
-            score[a.name] += 1
-            score[b.name] += 1
+    # очки по позициям в STRATEGIES
+    score = np.zeros(len(STRATEGIES), dtype=np.int64)
+
+    pairs = list(itertools.combinations(range(len(STRATEGIES)), 2))
+    if SWAP_SEATS:
+        pairs += [(j, i) for i, j in pairs]
+    # матчи независимы – раздаём их по процессам
+    results = run_matches([(STRATEGIES[i].pooled, STRATEGIES[j].pooled) for i, j in pairs])
+    for (i, j), result in zip(pairs, results):
+        _award(score, i, j, match_outcome(result))
 
     # --- печать таблицы ---
     print("=== RESULTS ===")
     width = max(len(s.name) for s in STRATEGIES) + 2
-    for s in STRATEGIES:
-        print(f"{s.name:<{width}} : {score[s.name]}")
+    for i, s in enumerate(STRATEGIES):
+        print(f"{s.name:<{width}} : {score[i]}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,15 @@
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+
+# Make `import autork` work for a bare `pytest` run from a source checkout
+# (the package is not installed and the repository root is not on sys.path).
+if find_spec("autork") is None:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def pytest_configure(config):
+    # Normally registered by pytest-xdist; declared here so runs without it don't warn.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the marked tests on one xdist worker"
+    )
@@ -0,0 +1,111 @@
+import itertools
+import random
+
+import numpy as np
+
+from autork.engine import Cmd, Engine, PlayerState
+from autork.engine_batch import BatchEngine, MIN_BATCH, run_many, _affordable
+from autork.config import GameSettings
+from autork.strategy import GreedyExpansionStrategy, RandomStrategy
+from autork.strategies_demo import (
+    UltraAggressiveStrategy,
+    UltraDefensiveStrategy,
+    EconomicBoomStrategyV2,
+)
+
+
+class SeededRandomStrategy(RandomStrategy):
+    """RandomStrategy with its own RNG so that matches are reproducible."""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+
+    def step(self, obs):
+        state = random.getstate()
+        random.seed(self.rng.random())
+        try:
+            return super().step(obs)
+        finally:
+            random.setstate(state)
+
+
+def _seeded_factory(start):
+    seeds = itertools.count(start)
+    return lambda: SeededRandomStrategy(next(seeds))
+
+
+def test_affordable_matches_loop():
+    for base, step, owned, budget, cap in itertools.product(
+        (0, 3, 10), (0, 1, 3), (0, 5, 17), (0, 9, 50, 1000), (0, 2, 1000)
+    ):
+        if base == 0 and step == 0:
+            continue
+        n = spent = 0
+        while n < cap and spent + base + step * (owned + n) <= budget:
+            spent += base + step * (owned + n)
+            n += 1
+        count, cost = _affordable(np.array([budget]), base, step, np.array([owned]), cap)
+        assert (count[0], cost[0]) == (n, spent)
+
+
+def test_upkeep_matches_player_state():
+    cfg = GameSettings.default()
+    eng = BatchEngine(RandomStrategy, RandomStrategy, 1, game_settings=cfg)
+    for gold, atk, dfn in itertools.product((0, 3, 20), (0, 1, 5), (0, 2, 9)):
+        p = PlayerState(cfg)
+        p.gold, p.attack, p.defense = gold, atk, dfn
+        p.apply_upkeep()
+        g, a, d = eng._apply_upkeep(np.array([gold]), np.array([atk]), np.array([dfn]))
+        assert (g[0], a[0], d[0]) == (p.gold, p.attack, p.defense)
+
+
+def test_batch_matches_engine_for_deterministic_strategies():
+    pairs = [
+        (UltraAggressiveStrategy, UltraDefensiveStrategy),
+        (GreedyExpansionStrategy, EconomicBoomStrategyV2),
+        (UltraDefensiveStrategy, UltraAggressiveStrategy),
+    ]
+    for a, b in pairs:
+        expected = Engine(a(), b(), trace=None).run()
+        assert BatchEngine(a, b, 4).run() == [expected] * 4
+
+
+def test_batch_matches_engine_with_different_match_lengths():
+    n = 12
+    results = BatchEngine(_seeded_factory(0), _seeded_factory(1000), n).run()
+    fa, fb = _seeded_factory(0), _seeded_factory(1000)
+    pairs = [(fa(), fb()) for _ in range(n)]
+    expected = [Engine(s1, s2, trace=None).run() for s1, s2 in pairs]
+    assert results == expected
+    assert len({r["turns"] for r in results}) > 1
+
+
+class _HugeRequestStrategy:
+    """Asks for far more than any int64 can hold, every turn."""
+
+    def reset(self, observation):
+        pass
+
+    def step(self, observation):
+        return Cmd(expand=10**20, spend_attack=10**20, spend_defense=10**20)
+
+
+def test_batch_matches_engine_on_huge_requests_and_free_units():
+    configs = [
+        GameSettings.default(),
+        GameSettings(ATK_BASE=0, ATK_K=0, DEF_BASE=0, DEF_K=0),
+        GameSettings(EXPAND_BASE=0, EXPAND_STEP=0),
+    ]
+    for cfg in configs:
+        expected = Engine(
+            _HugeRequestStrategy(), UltraDefensiveStrategy(), trace=None, game_settings=cfg
+        ).run()
+        batch = BatchEngine(_HugeRequestStrategy, UltraDefensiveStrategy, 2, game_settings=cfg)
+        assert batch.run() == [expected] * 2
+
+
+def test_run_many_plays_small_batches_through_engine():
+    expected = Engine(UltraAggressiveStrategy(), UltraDefensiveStrategy(), trace=None).run()
+    assert run_many(UltraAggressiveStrategy, UltraDefensiveStrategy, MIN_BATCH - 1) == (
+        [expected] * (MIN_BATCH - 1)
+    )
@@ -0,0 +1,192 @@
+import pytest
+
+from autork.engine import PlayerState, Engine, Cmd
+from autork.config import GameSettings
+
+# one worker per file under `pytest -n auto --dist=loadgroup`
+pytestmark = pytest.mark.xdist_group("engine_core")
+
+
+# Immutable and shared: the engine takes a Cmd as is, without copying
+_SKIP_TURN = Cmd()
+
+
+class _DummyStrategy:
+    """A minimal do‑nothing strategy useful for deterministic unit tests."""
+
+    __slots__ = ()
+
+    def reset(self, observation):
+        pass
+
+    def step(self, observation):
+        # Return an empty command – the engine will treat it as ‘skip turn’.
+        return _SKIP_TURN
+
+
+# stateless, so one instance serves both seats of every engine
+_DUMMY = _DummyStrategy()
+
+
+# ---------------------------------------------------------------------------
+# Engine core mechanic tests (allocate_neutral, resolve_combat, winner logic)
+# ---------------------------------------------------------------------------
+
+
+# Initial PlayerState fields (slots), snapshotted once for the per-test reset
+_PLAYER_DEFAULTS = {
+    name: getattr(PlayerState(GameSettings.default()), name)
+    for name in PlayerState.__slots__
+    if name != "cfg"
+}
+
+
+@pytest.fixture(scope="module")
+def _engine_proto():
+    """One Engine with dummy strategies and muted trace, shared by the module."""
+    return Engine(_DUMMY, _DUMMY, trace=lambda *_: None)
+
+
+@pytest.fixture
+def eng(_engine_proto):
+    """The shared Engine with players and neutral territory back at their defaults."""
+    e = _engine_proto
+    for player in (e.p1, e.p2):
+        for name, value in _PLAYER_DEFAULTS.items():
+            setattr(player, name, value)
+    e.turn = 0
+    e.neutral_territory = e.cfg.NEUTRAL_TERRITORY
+    return e
+
+
+def test_allocate_neutral_contested(eng):
+    start_territory = eng.cfg.START_TERRITORY
+    eng.neutral_territory = 5
+    eng.p1.pending_expands = 3
+    eng.p2.pending_expands = 3
+
+    eng._allocate_neutral()
+
+    # All 3 contested → none granted, neutral remains 5
+    assert eng.p1.territory == start_territory
+    assert eng.p2.territory == start_territory
+    assert eng.neutral_territory == 5
+
+
+def test_allocate_neutral_unique(eng):
+    start_territory = eng.cfg.START_TERRITORY
+    eng.neutral_territory = 4
+    eng.p1.pending_expands = 3  # wants 3 unique
+    eng.p2.pending_expands = 0
+
+    eng._allocate_neutral()
+
+    assert eng.p1.territory == start_territory + 3
+    assert eng.neutral_territory == 1  # 4 - 3 = 1 left
+
+
+def test_resolve_combat_shift_territory(eng):
+    # set forces
+    eng.p1.attack = 12
+    eng.p1.defense = 5
+    eng.p2.attack = 5
+    eng.p2.defense = 10
+    eng.p1.territory = 30
+    eng.p2.territory = 30
+    eng.neutral_territory = 0
+
+    eng._resolve_combat()
+
+    assert eng.p1.territory == 30  # no losses
+    assert eng.p2.territory == 28  # lost 2 cells
+    assert eng.neutral_territory == 2  # captured cells become neutral
+
+
+def test_winner_detection_by_territory(eng):
+    eng.p1.territory = 0
+    eng.p2.territory = 10
+
+    assert eng._check_winner() == "player2"
+
+    eng.p2.territory = 0
+    assert eng._check_winner() == "draw"
+
+
+def test_winner_detection_by_gold_on_timeout(eng):
+    eng.p1.gold = 100
+    eng.p2.gold = 50
+    # Both still have territory, simulate end‑of‑game flag
+    assert eng._check_winner(is_end=True) == "player1"
+
+
+def test_prepare_obs_is_fresh_and_hides_enemy_without_intel(eng):
+    eng.p1.has_enemy_intel = True
+    obs, prices = eng._prepare_obs(eng.p1, eng.p2)
+    assert obs["enemy"] == {
+        "territory": eng.p2.territory,
+        "gold": eng.p2.gold,
+        "attack": eng.p2.attack,
+        "defense": eng.p2.defense,
+    }
+    assert prices is obs["prices"]
+
+    eng.p1.has_enemy_intel = False
+    start_gold = eng.p1.gold
+    eng.p1.gold = start_gold + 7
+    obs_again, _ = eng._prepare_obs(eng.p1, eng.p2)
+    assert obs_again["enemy"] == {"territory": eng.p2.territory}
+    assert obs_again["my"]["gold"] == obs_again["limits"]["gold"] == start_gold + 7
+    # a strategy may keep the previous observation: it is not overwritten
+    assert obs["my"]["gold"] == obs["limits"]["gold"] == start_gold
+    assert len(obs["enemy"]) == 4
+
+
+def test_history_records_every_turn():
+    # a full run replaces the players and history, so not the shared engine
+    eng = Engine(_DUMMY, _DUMMY, trace=None)
+    result = eng.run()
+    assert eng.history.shape == (result["turns"] + 1, 10)
+    last = eng.history_as_dicts()[-1]
+    assert last["turn"] == result["turns"]
+    assert last["neutral"] == result["neutral"]
+    assert last["p1"] == result["p1"] and last["p2"] == result["p2"]
+
+
+def test_history_holds_large_gold():
+    cfg = GameSettings.default().model_copy(update={"START_GOLD": 3_000_000_000, "MAX_TURNS": 5})
+    eng = Engine(_DUMMY, _DUMMY, trace=None, game_settings=cfg)
+    result = eng.run()
+    assert result["p1"]["gold"] > 3_000_000_000
+    assert eng.history_as_dicts()[-1]["p1"] == result["p1"]
+
+
+def test_settings_stay_mutable_and_engine_snapshots_them():
+    cfg = GameSettings.default().model_copy()
+    cfg.MAX_TURNS = 7
+    eng = Engine(_DUMMY, _DUMMY, trace=None, game_settings=cfg)
+    cfg.MAX_TURNS = 3  # the engine keeps the frozen snapshot taken above
+    assert eng.run()["turns"] == 7
+    assert Engine(_DUMMY, _DUMMY, trace=None, game_settings=cfg).run()["turns"] == 3
+
+
+def test_strategy_may_return_cmd_tuple():
+    class DictStrategy(_DummyStrategy):
+        def step(self, observation):
+            return {"expand": 2, "spend_defense": 15, "scout": True}
+
+    class CmdStrategy(_DummyStrategy):
+        def step(self, observation):
+            return Cmd(expand=2, spend_defense=15, scout=True)
+
+    by_dict = Engine(DictStrategy(), _DUMMY, trace=None).run()
+    by_cmd = Engine(CmdStrategy(), _DUMMY, trace=None).run()
+    assert by_dict == by_cmd
+
+
+def test_reused_strategies_replay_the_same_match():
+    from autork.strategies_demo import EconomicBoomStrategyV2, UltraDefensiveStrategyV2
+
+    fresh = Engine(UltraDefensiveStrategyV2(), EconomicBoomStrategyV2(), trace=None).run()
+    s1, s2 = UltraDefensiveStrategyV2(), EconomicBoomStrategyV2()
+    Engine(s2, s1, trace=None).run()
+    assert Engine(s1, s2, trace=None).run() == fresh
@@ -0,0 +1,36 @@
+import itertools
+
+from autork._fast import encode_strategy, play_numeric
+from autork.config import GameSettings
+from autork.engine import Engine
+from autork.strategy import GreedyExpansionStrategy, RandomStrategy
+from autork.strategies_demo import (
+    EconomicBoomStrategyV2,
+    UltraAggressiveStrategy,
+    UltraDefensiveStrategy,
+)
+
+
+def test_play_numeric_matches_engine():
+    factories = [
+        GreedyExpansionStrategy,
+        UltraAggressiveStrategy,
+        UltraDefensiveStrategy,
+        lambda: UltraAggressiveStrategy(reserve_gold=7, attack_fraction=0.55, expand_first_n=4, scout_every=3),
+        lambda: UltraDefensiveStrategy(defense_floor=3, defense_focus_turns=2, expand_budget_ratio=0.9),
+    ]
+    configs = [
+        GameSettings.default(),
+        GameSettings(START_GOLD=37, NEUTRAL_TERRITORY=60, MAX_TURNS=150, SCOUT_COST=3),
+        # free cells: the strategies divide by the price and their turn is skipped
+        GameSettings(EXPAND_BASE=0, EXPAND_STEP=0),
+    ]
+    for (a, b), cfg in itertools.product(itertools.product(factories, repeat=2), configs):
+        expected = Engine(a(), b(), trace=None, game_settings=cfg).run()
+        assert play_numeric(a(), b(), cfg) == expected
+
+
+def test_non_numeric_strategies_are_not_encoded():
+    assert encode_strategy(RandomStrategy()) is None
+    assert encode_strategy(EconomicBoomStrategyV2()) is None
+    assert play_numeric(UltraAggressiveStrategy(), RandomStrategy()) is None
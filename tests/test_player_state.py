@@ -0,0 +1,93 @@
+import pytest
+
+from autork.engine import PlayerState
+from autork.config import GameSettings
+
+# one worker per file under `pytest -n auto --dist=loadgroup`
+pytestmark = pytest.mark.xdist_group("player_state")
+
+
+# ---------------------------------------------------------------------------
+# PlayerState unit tests
+# ---------------------------------------------------------------------------
+
+_CFG = GameSettings.default()
+
+# (cfg overrides, initial fields, [(method or None, args, expected return, expected fields)])
+ECONOMY_CASES = [
+    pytest.param(
+        {}, {"territory": 25},
+        [("income", (), 25, {})],
+        id="income",
+    ),
+    pytest.param(
+        {"START_ATTACK": 3, "START_DEFENSE": 2, "START_GOLD": 2}, {},
+        [
+            (None, (), None, {"attack": 3, "defense": 2, "gold": 2}),
+            # upkeep cost = 5 ⇒ gold negative ⇒ units disband starting with attack
+            ("apply_upkeep", (), None, {"gold": 0, "attack": 0, "defense": 2}),
+        ],
+        id="upkeep_disbands_attack_before_defense",
+    ),
+    pytest.param(
+        {"EXPAND_BASE": 10, "EXPAND_STEP": 1}, {"gold": 50},
+        [
+            # First three expansion prices 10, 11, 12 by default
+            ("expand_price", (), 10, {}),
+            ("expand_price", (1,), 11, {}),  # simulate second cell in same turn
+            ("pay_for_expands", (3,), 3, {"gold": 17, "pending_expands": 3}),  # 50 - (10+11+12)
+            # Gold is only 17 → can afford 13 & 14 (total 27) – 1 actually, so 1
+            ("pay_for_expands", (3,), 1, {}),
+        ],
+        id="expand_price_and_payment",
+    ),
+    pytest.param(
+        {}, {"gold": 50},
+        [
+            # beyond int64: only what gold allows is bought (10+11+12+13 = 46)
+            ("pay_for_expands", (10**20,), 4, {"gold": 4, "pending_expands": 4}),
+            ("pay_for_expands", (-10**20,), 0, {"gold": 4, "pending_expands": 0}),
+        ],
+        id="oversized_expand_request",
+    ),
+    pytest.param(
+        {"EXPAND_BASE": 0, "EXPAND_STEP": 0, "ATK_BASE": 0, "ATK_K": 0}, {"gold": 5},
+        [
+            # free cells: every requested one is bought
+            ("pay_for_expands", (3,), 3, {"gold": 5, "pending_expands": 3}),
+            # free units have no natural limit, so none are bought
+            ("buy_attack", (5,), 0, {"attack": _CFG.START_ATTACK, "gold": 5}),
+        ],
+        id="free_cells_and_units",
+    ),
+    pytest.param(
+        {}, {"gold": 60},
+        [
+            # prices 20, 21, 22 – only 2 units within 60 (20 + 21 = 41)
+            ("buy_attack", (60,), 41, {"attack": _CFG.START_ATTACK + 2, "gold": 19}),
+            # prices 9, 12 – only 1 unit within 19
+            ("buy_defense", (19,), 9, {"defense": _CFG.START_DEFENSE + 1, "gold": 10}),
+        ],
+        id="buy_attack_and_defense",
+    ),
+]
+
+
+@pytest.mark.parametrize("cfg_kw,init,calls", ECONOMY_CASES)
+def test_player_state_economy(cfg_kw, init, calls):
+    p = PlayerState(_CFG.model_copy(update=cfg_kw) if cfg_kw else _CFG)
+    for name, value in init.items():
+        setattr(p, name, value)
+    for method, args, result, fields in calls:
+        if method is not None:
+            assert getattr(p, method)(*args) == result
+        for name, value in fields.items():
+            assert getattr(p, name) == value
+
+
+def test_player_state_repr_and_eq():
+    p, q = PlayerState(_CFG), PlayerState(_CFG)
+    assert p == q
+    assert repr(p).startswith(f"PlayerState(gold={_CFG.START_GOLD}, territory=")
+    q.gold += 1
+    assert p != q
@@ -0,0 +1,28 @@
+import itertools
+
+from autork.engine import Engine
+from autork.tournament import run_matches
+from autork.strategy import GreedyExpansionStrategy
+from autork.strategies_demo import (
+    UltraAggressiveStrategy,
+    UltraDefensiveStrategy,
+    EconomicBoomStrategy,
+)
+
+PAIRS = list(
+    itertools.permutations(
+        [UltraAggressiveStrategy, UltraDefensiveStrategy, EconomicBoomStrategy, GreedyExpansionStrategy], 2
+    )
+)
+
+
+def _expected():
+    return [Engine(a(), b(), trace=None).run() for a, b in PAIRS]
+
+
+def test_run_matches_serial():
+    assert run_matches(PAIRS, workers=1) == _expected()
+
+
+def test_run_matches_in_process_pool_keeps_order():
+    assert run_matches(PAIRS, workers=2) == _expected()